@@ -16,7 +16,7 @@ from jsonschema import validate
 from jsonschema.exceptions import ValidationError
 from atlassian import Confluence
 
-import gists
+from gistops_core import gists
 
 
 @dataclass
@@ -6,6 +6,7 @@ import os
 import sys
 import zipfile
 import shutil
+import json
 from pathlib import Path
 
 import pytest
@@ -136,3 +137,40 @@ def test_confluence_publish(mocker):
 
     assert Path.cwd().joinpath('.gistops').joinpath('confluence.gistops.trail').exists()
     assert Path.cwd().joinpath('.gistops').joinpath('confluence.gistops.log').exists()
+
+
+def test_confluence_publish_ndjson(mocker):
+    """Tests gists streamed as ndjson event file are published"""
+
+    def __connect_to_api( url: str, access_token: str ):
+        return publishing.ConfluenceAPI(
+          url=url, api=FakeConfluenceApi(), 
+          access_token=None, username=None, password=None)
+
+    mocker.patch('publishing.connect_to_api', side_effect=__connect_to_api)
+    publish = mocker.spy(publishing, 'publish')
+
+    gist_record = {
+      "path": ".gistops/data/howtos/how-to-setup-a-scalable-vpc-architecture/README.{suffix}",
+      "tags": {"confluence":{"page":"117605798","host":"verw.bssn.eu"}},
+      "commit_id": "ccab44e",
+      "resources": ["howtos/how-to-setup-a-scalable-vpc-architecture:*"],
+      "trace_id": "howtos/how-to-setup-a-scalable-vpc-architecture/README.md",
+      "title": "How to setup a scalable vpc architecture" }
+
+    ndjson_path = Path.cwd().joinpath('.gistops').joinpath('gists.ndjson')
+    ndjson_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(ndjson_path,'w',encoding='utf-8') as ndjson_file:
+        ndjson_file.write('{"semver":"0.1.0-beta","record-type":"Gist"}\n')
+        for suffix in ['pdf','jira']:
+            ndjson_file.write(json.dumps({
+              **gist_record, "path": gist_record['path'].format(suffix=suffix)}) + '\n')
+
+    main.GistOps(cwd=str(Path.cwd())).run( 
+      event_base64=str(ndjson_path),
+      confluence_url='https://verw.bssn.eu/wiki',
+      confluence_access_token='unknown' )
+
+    # ... pages are published before their attachments
+    assert [call.kwargs['gist'].path.suffix for call in publish.call_args_list] == ['.jira','.pdf']
+
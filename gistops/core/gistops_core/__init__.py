@@ -0,0 +1,4 @@
+#!/usr/bin/env python3
+"""
+Gist representation, event codecs and logging shared by all gistops stages
+"""
@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+"""
+Gist Representation and Factories
+"""
+import json
+import base64
+from pathlib import Path
+from dataclasses import dataclass
+from typing import List, Iterable, Iterator, TextIO
+
+import semver
+from jsonschema import validators
+
+from gistops_core import version
+
+######################
+# SCHEMA DEFINITIONS #
+######################
+__RECORD_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "path": {"type": "string"},
+        "commit_id": {"type": "string"},
+        "tags": {"type":"object"},
+        "resources": {
+            "type": "array",
+            "items": { "type": "string" }
+        },
+        "trace_id": {"type": "string"},
+        "title": {"type": "string"}
+    },
+    "required": ["path", "commit_id", "tags", "resources", "trace_id", "title"]
+}
+
+__HEADER_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "semver": {"const": version.__semver__},
+        "record-type": {"const": "Gist"}
+    },
+    "required": ["semver","record-type"]
+}
+
+__GISTS_FILE_SCHEMA = {
+    "type": "array",
+    "items": {
+        "type": "object",
+        "properties": {
+            "path": {"type": "string"},
+            "commit_id": {"type": "string"},
+            "tags": {"type":"object"}
+        },
+        "required": ["path","commit_id","tags"]
+    }
+}
+
+__EVENT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "semver": {"const": version.__semver__},
+        "record-type": {"const": "Gist"},
+        "records": {
+            "type": "array",
+            "items": __RECORD_SCHEMA
+        }
+    },
+    "required": ["semver","record-type","records"]
+}
+
+
+def __compile(schema: dict):
+    """Check schema against its meta schema once and build a reusable validator"""
+    validator_cls = validators.validator_for(schema)
+    validator_cls.check_schema(schema)
+    return validator_cls(schema)
+
+
+__RECORD_VALIDATOR = __compile(__RECORD_SCHEMA)
+__HEADER_VALIDATOR = __compile(__HEADER_SCHEMA)
+__EVENT_VALIDATOR = __compile(__EVENT_SCHEMA)
+__GISTS_FILE_VALIDATOR = __compile(__GISTS_FILE_SCHEMA)
+
+
+def __validate_record(rec: dict):
+    """Cheap structural check per record, the validator only explains failures"""
+    if isinstance(rec, dict) \
+      and all(isinstance(rec.get(key), str) for key in ('path','commit_id','trace_id','title')) \
+      and isinstance(rec.get('tags'), dict) \
+      and isinstance(rec.get('resources'), list) \
+      and all(isinstance(resource, str) for resource in rec['resources']):
+        return # ... same as __RECORD_SCHEMA without tracking schema paths
+
+    __RECORD_VALIDATOR.validate(rec)
+
+
+##################
+# EXPORTED TYPES #
+##################
+class GistOpsError(Exception):
+    """ GistOps representation error """
+
+
+@dataclass
+class Gist:
+    """ Gist representation """
+    __slots__ = ('path', 'commit_id', 'tags', 'resources', 'trace_id', 'title')
+
+    path: Path
+    commit_id: str
+    tags: dict
+    resources: List[str]
+    trace_id: Path
+    title: str
+
+
+def __assert_semver_major(event_semver_str: str):
+    """Raise if event was written by incompatible major version"""
+    event_semver = semver.VersionInfo.parse(event_semver_str)
+    this_semver = semver.VersionInfo.parse(version.__semver__)
+    if event_semver.major != this_semver.major:
+        raise GistOpsError(
+          f"Event semver major version differ {event_semver_str} != {version.__semver__}")
+
+
+def __from_basic_dict(rec: dict) -> Gist:
+    """Returns gist from dict using basic types"""
+    return Gist(
+        Path(rec['path']), 
+        rec['commit_id'], 
+        rec['tags'], 
+        rec['resources'], 
+        Path(rec['trace_id']), 
+        rec['title'] )
+
+
+def __from_base64(event_base64: str) -> dict:
+    """Decode base64 encoded json event"""
+    try:
+        base64_bytes = event_base64.encode('ascii')
+        message_bytes = base64.b64decode(base64_bytes)
+        return json.loads(message_bytes.decode('ascii'))
+    except json.JSONDecodeError as err:
+        raise GistOpsError('Invalid event') from err
+
+
+def from_event(event_base64: str) -> List[Gist]:
+    """ Read Gists Event """ 
+
+    event: dict = __from_base64(event_base64)
+
+    __EVENT_VALIDATOR.validate(event)
+    __assert_semver_major(event['semver'])
+
+    return [ __from_basic_dict(rec) for rec in event['records'] ]
+
+
+def iterate_event(event_base64: str) -> Iterator[Gist]:
+    """ Read Gists Event validating record by record while iterating """
+
+    event: dict = __from_base64(event_base64)
+
+    __HEADER_VALIDATOR.validate(event)
+    __assert_semver_major(event['semver'])
+    if not isinstance(event.get('records'), list):
+        raise GistOpsError('Invalid event, records must be a list')
+
+    for rec in event['records']:
+        __validate_record(rec)
+        yield __from_basic_dict(rec)
+
+
+def __from_ndjson_lines(header_line: str, record_lines: Iterable[str]) -> Iterator[Gist]:
+    """Validate header once, then each record as it is read"""
+    try:
+        header: dict = json.loads(header_line)
+    except json.JSONDecodeError as err:
+        raise GistOpsError('Invalid event header') from err
+
+    __HEADER_VALIDATOR.validate(header)
+    __assert_semver_major(header['semver'])
+
+    for record_line in record_lines:
+        if len(record_line.strip()) == 0:
+            continue # ... e.g. trailing newline
+
+        try:
+            rec: dict = json.loads(record_line)
+        except json.JSONDecodeError as err:
+            raise GistOpsError(f'Invalid event record {record_line[:80]}') from err
+
+        __validate_record(rec)
+        yield __from_basic_dict(rec)
+
+
+def from_ndjson(ndjson_file: TextIO) -> Iterator[Gist]:
+    """ Read Gists Event streamed as newline delimited json """
+    return __from_ndjson_lines(ndjson_file.readline(), ndjson_file)
+
+
+def read_event(event: str) -> Iterator[Gist]:
+    """ Read Gists from base64 event, a file containing it or a ndjson file or pipe """
+    try:
+        event_path = Path(event)
+        is_event_file = event_path.exists() and not event_path.is_dir()
+    except OSError:
+        is_event_file = False # e.g. filename to long for base64
+
+    if not is_event_file:
+        yield from iterate_event(event)
+        return
+
+    with open(event_path, 'r', encoding='utf-8') as event_file:
+        # ndjson starts with its header object, base64 never contains '{'
+        first_line = event_file.readline()
+        if first_line.lstrip().startswith('{'):
+            yield from __from_ndjson_lines(first_line, event_file)
+        else:
+            yield from iterate_event(first_line + event_file.read())
+
+
+def from_file(gists_json_path: Path) -> List[Gist]:
+    """ Read Gists from gists.json, older files only hold path, commit_id and tags """ 
+
+    try:
+        with open(gists_json_path, 'r', encoding='utf-8') as gists_json_file:
+            gsts: list = json.loads(gists_json_file.read())
+    except json.JSONDecodeError as err:
+        raise GistOpsError('Invalid event') from err
+
+    __GISTS_FILE_VALIDATOR.validate(gsts)
+
+    return [ Gist(
+        Path(rec['path']), 
+        rec['commit_id'], 
+        rec['tags'], 
+        rec.get('resources', []), 
+        Path(rec.get('trace_id', rec['path'])), 
+        rec.get('title', Path(rec['path']).name) ) for rec in gsts ]
+
+
+def to_basic_dict(gist: Gist) -> dict:
+    """Returns gist as dict using basic types"""
+    return {
+        'path': str(gist.path),
+        'tags': gist.tags,
+        'commit_id': gist.commit_id,
+        'resources': gist.resources,
+        'trace_id': str(gist.trace_id),
+        'title': gist.title }
+
+
+def to_event(gists: List[Gist]) -> str:
+    """Returns gist as dict using basic types"""
+
+    event = {
+        "semver": version.__semver__,
+        "record-type": 'Gist',
+        "records": [to_basic_dict(gist) for gist in gists] }
+
+    __EVENT_VALIDATOR.validate(event)
+
+    def __to_base64(event_str: str) -> str:
+        message_bytes = event_str.encode('ascii')
+        base64_bytes = base64.b64encode(message_bytes)
+        return base64_bytes.decode('ascii')
+
+    return __to_base64(
+      json.dumps(event, separators=(',',':')))
+
+
+def to_ndjson(gists: Iterable[Gist], ndjson_path: Path) -> str:
+    """Streams gists as newline delimited json with a header line to file or pipe"""
+
+    with open(ndjson_path, 'w', encoding='utf-8') as ndjson_file:
+        ndjson_file.write(json.dumps({
+          "semver": version.__semver__,
+          "record-type": 'Gist' }, separators=(',',':')) + '\n')
+
+        for gist in gists:
+            rec = to_basic_dict(gist)
+            __validate_record(rec)
+            ndjson_file.write(json.dumps(rec, separators=(',',':')) + '\n')
+
+    return str(ndjson_path)
+
+
+def j2_params(gist: Gist) -> dict:
+    """Returns the gist as dict"""
+    return {
+      'name': str(gist.path.name),
+      'dir': str(gist.path.parent),
+      'stem': str(gist.path.stem),
+      'suffix': str(gist.path.suffix),
+      'parent': str(gist.path.parent.name),
+      **to_basic_dict(gist) }
+
+
+######################
+# EXPORTED FUNCTIONS #
+######################
+def assert_git_root(gist_absolute_path: Path) -> Path:
+    """Locate git root directory from gist_path"""
+    if not gist_absolute_path.exists():
+        raise GistOpsError(f'{gist_absolute_path} does not exist')
+
+    def traverse_upwards(gist_path: Path) -> Path:
+        if gist_path == gist_path.parent:
+            return None
+
+        # .git is a directory or, for worktrees and submodules, a file
+        if gist_path.is_dir() and gist_path.joinpath('.git').exists():
+            return gist_path
+
+        return traverse_upwards(gist_path.parent)
+
+    git_root_path = traverse_upwards(gist_absolute_path.resolve())
+    if not git_root_path:
+        raise GistOpsError(
+            f'{gist_absolute_path} is not in a git repository. '
+            'Please run from valid git repository')
+
+    return git_root_path
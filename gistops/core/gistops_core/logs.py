@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Logging to *.gistops.log and trailing to *.gistops.trail
+"""
+import os
+import logging
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, List, Tuple
+
+
+######################
+# EXPORTED FUNCTIONS #
+######################
+def init_logs(
+  logspath: Path,
+  prefix: str,
+  version: str,
+  trail: bool = True) -> List[Tuple[logging.Logger, logging.Handler]]:
+    """Log to {prefix}.gistops.log and trail to {prefix}.gistops.trail in logspath"""
+    logspath.mkdir(parents=True, exist_ok=True)
+    datefmt='%Y-%m-%dT%H:%M:%SZ'
+
+    # Logs to gistops.log
+    logger = logging.getLogger()
+    logfile = logging.FileHandler(
+      logspath.joinpath(f'{prefix}.gistops.log'))
+    logfile.setFormatter(logging.Formatter(
+        f'{prefix},%(levelname)s,%(asctime)s,%(message)s', datefmt=datefmt ))
+    logger.addHandler(logfile)
+    logger.setLevel(os.environ.get('LOG_LEVEL','INFO'))
+    logger.info(version)
+
+    if not trail:
+        return [(logger, logfile)] # ... e.g. reporting stages only read trails
+
+    # Trailing to gistops.trail
+    traillog = logging.getLogger('gistops.trail')
+    traillogfile = logging.FileHandler(
+      logspath.joinpath(f'{prefix}.gistops.trail'))
+    traillogfile.setFormatter(logging.Formatter(
+        f'{prefix},%(levelname)s,%(asctime)s,%(message)s', datefmt=datefmt ))
+    traillog.addHandler(traillogfile)
+    traillog.setLevel(os.environ.get('LOG_LEVEL','INFO'))
+
+    return [(logger, logfile), (traillog, traillogfile)]
+
+
+@contextmanager
+def stage_logs(
+  logspath: Path,
+  prefix: str,
+  version: str,
+  trail: bool = True) -> Iterator[None]:
+    """Like init_logs but only while the stage runs, e.g. for stages sharing a process"""
+    handlers = init_logs(logspath=logspath, prefix=prefix, version=version, trail=trail)
+    try:
+        yield
+    finally:
+        for logger, handler in handlers:
+            logger.removeHandler(handler)
+            handler.close()
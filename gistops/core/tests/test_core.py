@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Tests for gistops core
+"""
+import os
+import sys
+import json
+import base64
+import logging
+from pathlib import Path
+
+import pytest
+from jsonschema.exceptions import ValidationError
+
+sys.path.append(
+  str(Path(os.path.realpath(__file__)).parent.parent))
+
+from gistops_core import gists, logs
+
+
+def __gist(idx: int = 0) -> gists.Gist:
+    return gists.Gist(
+      path=Path(f'howtos/howto-{idx}/README.md'),
+      commit_id='ccab44e',
+      tags={'confluence':{'page':'117605798','host':'verw.bssn.eu'}},
+      resources=[f'howtos/howto-{idx}:**/*.*'],
+      trace_id=Path(f'howtos/howto-{idx}/README.md'),
+      title=f'howto-{idx}-README.md')
+
+
+def test_gist_is_slotted():
+    """Tests gists hold no per instance dict"""
+    assert not hasattr(__gist(), '__dict__')
+
+
+def test_base64_event_roundtrip():
+    """Tests gists survive to_event and from_event or iterate_event"""
+    gsts = [__gist(idx) for idx in range(3)]
+    event_base64 = gists.to_event(gsts)
+
+    assert gists.from_event(event_base64) == gsts
+    assert list(gists.iterate_event(event_base64)) == gsts
+    assert list(gists.read_event(event_base64)) == gsts
+
+
+def test_ndjson_event_roundtrip(tmp_path: Path):
+    """Tests gists survive to_ndjson and read_event"""
+    gsts = [__gist(idx) for idx in range(3)]
+    event_ndjson = gists.to_ndjson(gsts, tmp_path.joinpath('gists.ndjson'))
+
+    assert list(gists.read_event(event_ndjson)) == gsts
+    with open(event_ndjson, 'r', encoding='utf-8') as ndjson_file:
+        assert list(gists.from_ndjson(ndjson_file)) == gsts
+
+
+def test_ndjson_records_are_validated_lazily(tmp_path: Path):
+    """Tests invalid ndjson records fail when they are read"""
+
+    ndjson_path = tmp_path.joinpath('invalid.ndjson')
+    with open(ndjson_path,'w',encoding='utf-8') as ndjson_file:
+        ndjson_file.write('{"semver":"0.1.0-beta","record-type":"Gist"}\n')
+        ndjson_file.write('{"path":"README.jira","commit_id":"ccab44e","tags":{},'
+          '"resources":[],"trace_id":"README.md","title":"README"}\n')
+        ndjson_file.write('{"path":"README.pdf"}\n')
+
+    gsts = gists.read_event(str(ndjson_path))
+    assert next(gsts).path == Path('README.jira')
+    with pytest.raises(ValidationError):
+        next(gsts)
+
+
+def test_event_semver_major_is_checked():
+    """Tests events of other major versions are rejected"""
+    event_base64 = base64.b64encode(json.dumps({
+      'semver': '1.0.0', 'record-type': 'Gist', 'records': [] }).encode('ascii')).decode('ascii')
+
+    with pytest.raises(ValidationError):
+        gists.from_event(event_base64)
+
+
+def test_gists_file_without_trace_id(tmp_path: Path):
+    """Tests gists.json holding only path, commit_id and tags is read"""
+    gists_json_path = tmp_path.joinpath('gists.json')
+    with open(gists_json_path, 'w', encoding='utf-8') as gists_json_file:
+        gists_json_file.write(json.dumps([
+          {'path': 'howtos/README.md', 'commit_id': 'ccab44e', 'tags': {}},
+          gists.to_basic_dict(__gist()) ]))
+
+    gsts = gists.from_file(gists_json_path)
+    assert gsts[0].trace_id == Path('howtos/README.md')
+    assert gsts[1] == __gist()
+
+
+def test_git_root(tmp_path: Path):
+    """Tests git root is found from sub directories only"""
+    tmp_path.joinpath('.git').mkdir()
+    tmp_path.joinpath('howtos').mkdir()
+
+    assert gists.assert_git_root(tmp_path.joinpath('howtos')) == tmp_path.resolve()
+    with pytest.raises(gists.GistOpsError):
+        gists.assert_git_root(tmp_path.joinpath('unknown'))
+
+
+def test_logs_and_trails(tmp_path: Path):
+    """Tests logs and trails are written with prefix"""
+    logs.init_logs(logspath=tmp_path, prefix='core', version='core 0.1.0')
+    logging.getLogger('gistops.trail').info('howtos/README.md,tested')
+
+    assert tmp_path.joinpath('core.gistops.log').exists()
+    with open(tmp_path.joinpath('core.gistops.trail'), 'r', encoding='utf-8') as trail_file:
+        assert trail_file.read().startswith('core,INFO,')
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for gistops core
+
+Run explicitly with
+> GISTOPS_BENCHMARK=1 python3 -m pytest -s tests/test_core_benchmark.py
+"""
+import os
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+import pytest
+
+sys.path.append(
+  str(Path(os.path.realpath(__file__)).parent.parent))
+
+from gistops_core import gists
+
+
+pytestmark = pytest.mark.skipif(
+  os.environ.get('GISTOPS_BENCHMARK') is None,
+  reason='benchmarks only run if GISTOPS_BENCHMARK is set')
+
+
+def __synthetic_gists(records: int) -> List[gists.Gist]:
+    return [ gists.Gist(
+      path=Path(f'dir-{idx:06d}/README.md'),
+      commit_id='ccab44e',
+      tags={'confluence':{'page':'117605798','host':'verw.bssn.eu'}},
+      resources=[f'dir-{idx:06d}:**/*.*'],
+      trace_id=Path(f'dir-{idx:06d}/README.md'),
+      title=f'dir-{idx:06d}-README.md' ) for idx in range(records) ]
+
+
+def __report(name: str, records: int, seconds: float):
+    print(f'\n{name}: {records} records took {seconds:.3f}s '
+      f'({records/seconds:,.0f} records/s)')
+
+
+def test_benchmark_event_codecs_100k_records(tmp_path: Path):
+    """Reports throughput of encoding and decoding 100k record events"""
+
+    records = 100000
+    gsts = __synthetic_gists(records)
+
+    started = time.perf_counter()
+    event_base64 = gists.to_event(gsts)
+    __report('to_event', records, time.perf_counter() - started)
+
+    started = time.perf_counter()
+    assert len(gists.from_event(event_base64)) == records
+    __report('from_event', records, time.perf_counter() - started)
+
+    started = time.perf_counter()
+    assert sum(1 for _ in gists.iterate_event(event_base64)) == records
+    __report('iterate_event', records, time.perf_counter() - started)
+
+    started = time.perf_counter()
+    event_ndjson = gists.to_ndjson(gsts, tmp_path.joinpath('gists.ndjson'))
+    __report('to_ndjson', records, time.perf_counter() - started)
+
+    started = time.perf_counter()
+    assert sum(1 for _ in gists.read_event(event_ndjson)) == records
+    __report('read_event ndjson', records, time.perf_counter() - started)
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Git Backends used to iterate gists
+"""
+import os
+import logging
+from abc import ABC, abstractmethod
+from functools import partial
+from pathlib import Path
+from typing import List, Dict
+
+from gistops_core import gists
+
+import shell
+
+
+##################
+# EXPORTED TYPES #
+##################
+class GitBackend(ABC):
+    """Git operations required to locate gists"""
+
+    @abstractmethod
+    def commit_id(self) -> str:
+        """Abbreviated id of the HEAD commit, like git log -1 --pretty=%h"""
+
+    @abstractmethod
+    def diff_files(self, git_hash: str) -> List[str]:
+        """Files changed by a commit, like git diff-tree --name-only -r"""
+
+    @abstractmethod
+    def ls_files(self, gist_path: Path) -> List[str]:
+        """Files of the index below gist_path, like git ls-files"""
+
+    @abstractmethod
+    def check_attrs(self, git_files: List[str]) -> Dict[str,str]:
+        """Value of gistops attribute per file, like git check-attr gistops"""
+
+    @abstractmethod
+    def tree_oids(self) -> Dict[str,str]:
+        """Object ids of all trees of the index, like git write-tree and git ls-tree"""
+
+    @abstractmethod
+    def config(self, key: str) -> str:
+        """Value of config key or None, like git config --get"""
+
+
+class ShellBackend(GitBackend):
+    """Runs git commands as sub processes"""
+
+    def __init__(self, cwd: Path, env: dict):
+        self.__shrun = partial(shell.shrun, cwd=cwd, env=env)
+        self.__shpipe = partial(shell.shpipe, cwd=cwd, env=env)
+
+
+    def commit_id(self) -> str:
+        return self.__shrun(
+          cmd=['git', 'log', '-1', '--pretty=%h']).strip()
+
+
+    def diff_files(self, git_hash: str) -> List[str]:
+        # https://git-scm.com/docs/git-diff-tree
+        return self.__shrun(
+          cmd=['git','diff-tree','--no-commit-id','--name-only','-r', git_hash]).splitlines()
+
+
+    def ls_files(self, gist_path: Path) -> List[str]:
+        # https://git-scm.com/docs/git-ls-files
+        # Paths are listed NUL separated and relative to git root
+        return [ git_ls_file for git_ls_file in self.__shpipe(
+          cmd=['git', 'ls-files', '-z', '--', str(gist_path)]).split('\0')
+          if len(git_ls_file) > 0 ]
+
+
+    def check_attrs(self, git_files: List[str]) -> Dict[str,str]:
+        if len(git_files) == 0:
+            return {}
+
+        # https://git-scm.com/docs/git-check-attr
+        # Paths are read NUL separated from stdin and output is
+        # <path> NUL <attribute> NUL <info> NUL for each path
+        git_attrs = self.__shpipe(
+          cmd=['git', 'check-attr', '--stdin', '-z', 'gistops'],
+          stdin='\0'.join(git_files) + '\0').split('\0')
+
+        return { git_attrs[idx]: git_attrs[idx+2] for idx in range(0, len(git_attrs)-2, 3) }
+
+
+    def tree_oids(self) -> Dict[str,str]:
+        try:
+            # https://git-scm.com/docs/git-write-tree and
+            # https://git-scm.com/docs/git-ls-tree
+            root_oid = self.__shpipe(cmd=['git', 'write-tree']).strip()
+            git_trees = self.__shpipe(cmd=['git', 'ls-tree', '-r', '-d', '-z', root_oid])
+        except shell.ShellError:
+            return {} # e.g. unmerged index entries, nothing to key with
+
+        # Trees are listed as <mode> SP tree SP <oid> TAB <path> NUL
+        tree_oids: Dict[str,str] = { '.': root_oid }
+        for git_tree in git_trees.split('\0'):
+            if len(git_tree) == 0:
+                continue # ... trailing NUL
+
+            git_tree_meta, git_tree_path = git_tree.split('\t', 1)
+            tree_oids[git_tree_path] = git_tree_meta.split(' ')[-1]
+
+        return tree_oids
+
+
+    def config(self, key: str) -> str:
+        try:
+            return self.__shpipe(
+              cmd=['git', 'config', '--get', key]).strip()
+        except shell.ShellError:
+            return None # ... not configured
+
+
+class Pygit2Backend(GitBackend):
+    """Reads index, trees and attributes in process using libgit2"""
+
+    def __init__(self, git_root: Path):
+        try:
+            # Optional dependency, see pyproject.toml
+            import pygit2 # pylint: disable=import-outside-toplevel
+        except ImportError as err:
+            raise gists.GistOpsError(
+              'pygit2 git backend requires pygit2, '
+              'please install with pip install pygit2') from err
+
+        self.__pygit2 = pygit2
+        self.__repo = pygit2.Repository(str(git_root))
+
+
+    def commit_id(self) -> str:
+        return self.__repo.head.peel(self.__pygit2.Commit).short_id
+
+
+    def diff_files(self, git_hash: str) -> List[str]:
+        commit = self.__repo.revparse_single(git_hash).peel(self.__pygit2.Commit)
+        if len(commit.parents) != 1:
+            return [] # ... as diff-tree without --root or -m
+
+        return [ delta.new_file.path for delta in self.__repo.diff(
+          commit.parents[0].tree, commit.tree).deltas ]
+
+
+    def ls_files(self, gist_path: Path) -> List[str]:
+        prefix = '' if str(gist_path) == '.' else f'{gist_path}/'
+        return [ entry.path for entry in self.__repo.index
+          if entry.path.startswith(prefix) ]
+
+
+    def check_attrs(self, git_files: List[str]) -> Dict[str,str]:
+        def as_check_attr(value) -> str:
+            if value is None:
+                return 'unspecified'
+            if value is True:
+                return 'set'
+            if value is False:
+                return 'unset'
+            return value
+
+        return { git_file: as_check_attr(self.__repo.get_attr(git_file, 'gistops'))
+          for git_file in git_files }
+
+
+    def tree_oids(self) -> Dict[str,str]:
+        try:
+            root = self.__repo[self.__repo.index.write_tree()]
+        except self.__pygit2.GitError:
+            return {} # e.g. unmerged index entries, nothing to key with
+
+        tree_oids: Dict[str,str] = {}
+        def walk(tree, tree_path: str):
+            tree_oids[tree_path] = str(tree.id)
+            for entry in tree:
+                if entry.type_str == 'tree':
+                    walk(self.__repo[entry.id],
+                      entry.name if tree_path == '.' else f'{tree_path}/{entry.name}')
+
+        walk(root, '.')
+        return tree_oids
+
+
+    def config(self, key: str) -> str:
+        try:
+            return self.__repo.config[key]
+        except KeyError:
+            return None # ... not configured
+
+
+######################
+# EXPORTED FUNCTIONS #
+######################
+def connect(git_backend: str, git_root: Path) -> GitBackend:
+    """Create git backend by name"""
+    logging.getLogger().info(f'Using {git_backend} git backend')
+
+    if git_backend == 'shell':
+        return ShellBackend(cwd=git_root.resolve(), env=os.environ)
+    if git_backend == 'pygit2':
+        return Pygit2Backend(git_root=git_root.resolve())
+
+    raise gists.GistOpsError(
+      f'Unknown git backend {git_backend}, must be one of [shell,pygit2]')
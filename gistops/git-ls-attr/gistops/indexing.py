@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Persistent index of gistops attributes resolved per directory
+"""
+import json
+import hashlib
+import logging
+from pathlib import Path
+from dataclasses import dataclass, field
+from typing import Dict, List, Iterable, Union
+
+import version
+
+
+##################
+# EXPORTED TYPES #
+##################
+@dataclass
+class AttributeIndex:
+    """Gists resolved per directory keyed by git object ids"""
+    path: Path
+    dirs: Dict[str,dict] = field(default_factory=dict)
+    hits: int = 0
+    misses: int = 0
+
+
+######################
+# EXPORTED FUNCTIONS #
+######################
+def blob_oid(blob_path: Union[str,Path]) -> str:
+    """Returns git blob object id of a file or '' if it does not exist"""
+    try:
+        with open(blob_path, 'rb') as blob_file:
+            blob = blob_file.read()
+    except OSError:
+        return ''
+
+    # https://git-scm.com/book/en/v2/Git-Internals-Git-Objects
+    return hashlib.sha1(b'blob %d\0' % len(blob) + blob).hexdigest()
+
+
+def digest(*oids: str) -> str:
+    """Combines object ids into a single key"""
+    return hashlib.sha1('\0'.join(oids).encode('utf-8')).hexdigest()
+
+
+def load(index_path: Path) -> AttributeIndex:
+    """Load index from disk, starts empty if missing or outdated"""
+    try:
+        with open(index_path, 'r', encoding='utf-8') as index_file:
+            index: dict = json.load(index_file)
+
+        if index['semver'] == version.__semver__:
+            return AttributeIndex(path=index_path, dirs=index['dirs'])
+    except (OSError, ValueError, KeyError):
+        pass # ... nothing to reuse
+
+    return AttributeIndex(path=index_path)
+
+
+def lookup(index: AttributeIndex, git_dir: str, key: str) -> List[dict]:
+    """Returns gists of directory if key is unchanged, otherwise None"""
+    entry = index.dirs.get(git_dir)
+    if entry is not None and entry['key'] == key:
+        index.hits += 1
+        return entry['gists']
+
+    index.misses += 1
+    return None
+
+
+def update(index: AttributeIndex, git_dir: str, key: str, gsts: List[dict]):
+    """Stores gists resolved for directory under key"""
+    index.dirs[git_dir] = {'key': key, 'gists': gsts}
+
+
+def store(index: AttributeIndex, git_dirs: Iterable[str]):
+    """Write index to disk keeping only directories still present"""
+    logger = logging.getLogger()
+
+    keep = set(git_dirs)
+    with open(index.path, 'w', encoding='utf-8') as index_file:
+        index_file.write(json.dumps({
+          'semver': version.__semver__,
+          'dirs': {
+            git_dir: entry for git_dir, entry in index.dirs.items() if git_dir in keep }
+        }, separators=(',',':')))
+
+    logger.info(
+      f'Attribute index {index.path} used with '
+      f'{index.hits} cache hits and {index.misses} cache misses')
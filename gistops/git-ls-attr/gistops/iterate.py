@@ -6,10 +6,12 @@ import os
 import json
 import logging
 from pathlib import Path
-from typing import List, Callable, Iterator
+from typing import List, Dict, Callable, Iterator
 
-import shell
-import gists
+from gistops_core import gists
+
+import backends
+import indexing
 
 
 #####################
@@ -35,7 +37,7 @@ def __init_gistops(
 
 
 def __ensure_gistops_attribute(
-  shrun: Callable[[List[str],bool], str],
+  git: backends.GitBackend,
   git_root: Path) -> Path:  
     """Verify [attr]gistops definition stored in .gitattributes"""
 
@@ -46,14 +48,9 @@ def __ensure_gistops_attribute(
       Path(git_root.joinpath('.git/info/attributes')), 
       Path(git_root.joinpath('.gitattributes')) ]
 
-    try:
-        global_attr_file = Path(
-          shrun(
-            cmd=['git','config','--global','--get','core.attributesfile'],
-            enforce_absolute_silence=True) )
-        attr_paths += global_attr_file
-    except shell.ShellError as _:
-        pass
+    global_attr_file = git.config('core.attributesfile')
+    if global_attr_file is not None:
+        attr_paths.append(Path(global_attr_file).expanduser())
 
     if 'HOME' in os.environ:
         attr_paths.append(
@@ -70,7 +67,7 @@ def __ensure_gistops_attribute(
 
         # Try to open as location
         try:
-            with open(str(attr_path),'r',encoding='utf-8') as candidate_file:
+            with open(str(candidate_path),'r',encoding='utf-8') as candidate_file:
                 candidate_attrs = candidate_file.read()
                 if candidate_attrs.find(__gistops_attribute()) >= 0:
                     return attr_path
@@ -80,29 +77,68 @@ def __ensure_gistops_attribute(
     __init_gistops(git_root=git_root)
 
 
+def __ls_files(
+  git: backends.GitBackend,
+  gist_path: Path) -> Dict[str,List[str]]:
+    """List files tracked below gist_path grouped by parent directory"""
+
+    # Note grouping by plain strings as pathlib is too slow for 100k+ files
+    git_dirs: Dict[str,List[str]] = {}
+    for git_ls_file in git.ls_files(gist_path):
+        git_dirs.setdefault(git_ls_file.rpartition('/')[0] or '.', []).append(git_ls_file)
+
+    return git_dirs
+
+
+def __attributes_oids(
+  git: backends.GitBackend,
+  git_root: Path) -> Callable[[str], str]:
+    """Key of all attribute files which apply to a directory"""
+
+    # See gitattributes precedence in https://git-scm.com/docs/gitattributes
+    attr_paths = [ git_root.joinpath('.git/info/attributes') ]
+    global_attr_file = git.config('core.attributesfile')
+    if global_attr_file is not None:
+        attr_paths.append(Path(global_attr_file).expanduser())
+
+    if 'XDG_CONFIG_HOME' in os.environ:
+        attr_paths.append(
+          Path(os.environ.get('XDG_CONFIG_HOME')).joinpath('git/attributes'))
+    if 'HOME' in os.environ:
+        attr_paths.append(
+          Path(os.environ.get('HOME')).joinpath('.config/git/attributes'))
+
+    # Changes of .gitattributes in any parent directory invalidate children
+    dir_oids: Dict[str,str] = {
+      '..': indexing.digest(*[indexing.blob_oid(attr_path) for attr_path in attr_paths]) }
+
+    def attributes_oid(git_dir: str) -> str:
+        if git_dir not in dir_oids:
+            parent_dir = '..' if git_dir == '.' else git_dir.rpartition('/')[0] or '.'
+            parent_oid = attributes_oid(parent_dir)
+            dir_oids[git_dir] = indexing.digest(
+              parent_oid, indexing.blob_oid(os.path.join(git_root, git_dir, '.gitattributes')))
+
+        return dir_oids[git_dir]
+
+    return attributes_oid
+
+
 ######################
 # EXPORTED FUNCTIONS #
 ######################
 def iterate_gists(
-  shrun: Callable[[List[str],bool], str], 
+  git: backends.GitBackend,
   git_root: Path,
   gist_path: Path,
-  git_diff_hash: str) -> Iterator[gists.Gist]:
+  index_path: Path = None) -> Iterator[gists.Gist]:
     """Locate gists in path using gistops attribute stored in .gitattributes"""
     logger = logging.getLogger()
 
-    __ensure_gistops_attribute(shrun=shrun, git_root=git_root)
+    __ensure_gistops_attribute(git=git, git_root=git_root)
 
     gist_absolute_path = git_root.joinpath(gist_path).resolve()
-    git_commit_id = shrun(
-      cmd=['git', 'log', '-1', '--pretty=%h']).strip()
-
-    git_diff_files: List[Path] = None
-    if git_diff_hash is not None:
-        # https://git-scm.com/docs/git-diff-tree
-        git_diff_files = [Path(fc) for fc in shrun(
-            cmd=['git','diff-tree','--no-commit-id','--name-only','-r', git_diff_hash]
-          ).splitlines()]
+    git_commit_id = git.commit_id()
 
     if not gist_absolute_path.is_dir():
         raise gists.GistOpsError(
@@ -110,47 +146,83 @@ def iterate_gists(
             'Symbolic links are not supported.'
             'Please provide directory as input')
 
-    for git_abspath in gist_absolute_path.glob('**/'):
-        if not git_abspath.is_dir():
-            continue # not a directory
-
-        try:
-            if git_abspath.relative_to(git_root.joinpath('.git')):
-                continue # ignore .git sub directory
-        except ValueError:
-            pass
-
-        git_dir = git_abspath.relative_to(git_root)
-
-        # https://git-scm.com/docs/git-check-attr and 
-        # https://git-scm.com/docs/git-ls-files
-        # Files with gistops .gitattribute listed as 
-        # README.md: gistops: {"render":{...}}
-        for git_ls_file in shrun(
-          cmd=['git','ls-files','--directory',f'"{str(git_dir)}"']).splitlines():
+    git_dirs = __ls_files(git=git, gist_path=gist_path)
+
+    # Reuse gists of directories whose tree and .gitattributes are unchanged
+    dir_gists: Dict[str,List[dict]] = {}
+    dir_keys: Dict[str,str] = {}
+    if index_path is not None:
+        index = indexing.load(index_path)
+        tree_oids = git.tree_oids()
+        attributes_oid = __attributes_oids(git=git, git_root=git_root)
+
+        for git_dir in git_dirs:
+            if git_dir not in tree_oids:
+                index.misses += 1
+                continue # e.g. index could not be written as tree
+
+            dir_keys[git_dir] = indexing.digest(tree_oids[git_dir], attributes_oid(git_dir))
+            cached_gists = indexing.lookup(index, git_dir, dir_keys[git_dir])
+            if cached_gists is not None:
+                dir_gists[git_dir] = cached_gists
+
+    # Files with gistops .gitattribute listed as 
+    # README.md: gistops: {"render":{...}}
+    git_attrs = git.check_attrs([
+      git_ls_file for git_dir, git_dir_files in git_dirs.items() 
+      if git_dir not in dir_gists for git_ls_file in git_dir_files ])
+
+    for git_dir, git_dir_files in git_dirs.items():
+        if git_dir in dir_gists:
+            continue # ... already resolved
+
+        dir_gists[git_dir] = []
+        for git_ls_file in git_dir_files:
+            gist_tags = git_attrs.get(git_ls_file, 'unspecified')
+            if gist_tags in ['unspecified', 'unset']:
+                continue # no gistops flag on this one
 
-            if Path(git_ls_file).parent != git_dir:
-                continue # ... only files of this directory please
+            # Note [:space:] filter according to
+            # https://github.com/git/git/blob/8d8387116ae8c3e73f6184471f0c46edbd2c7601/Documentation/gitattributes.txt#L563-L564
+            dir_gists[git_dir].append({
+              'path': git_ls_file,
+              'tags': json.loads(gist_tags.replace('[[:space:]]',' ')) if gist_tags != 'set' else {} })
 
-            gitattr = shrun(
-              cmd=['git', 'check-attr', 'gistops', '--', f'"{git_ls_file}"']).rstrip('\r\n')
+        if git_dir in dir_keys:
+            indexing.update(index, git_dir, dir_keys[git_dir], dir_gists[git_dir])
 
-            if gitattr.split(': ')[-1].find('unspecified') >= 0:
-                continue # no gistops flag on this one
+    if index_path is not None and len(tree_oids) > 0:
+        try:
+            indexing.store(index, git_dirs=tree_oids.keys())
+        except OSError as err:
+            logger.warning(f'Attribute index {index_path} not stored: {err}')
 
-            gist_file, _, gist_tags = gitattr.split(': ')
-            gist_file_path = Path(gist_file)
-            if git_diff_files is not None and \
-                gist_file_path not in git_diff_files:
-                logger.info(f'{gist_file} unchanged for {git_diff_hash}')
-                continue
+    for git_dir in git_dirs:
+        for dir_gist in dir_gists[git_dir]:
+            gist_file_path = Path(dir_gist['path'])
 
-            # Note [:space:] filter according to
-            # https://github.com/git/git/blob/8d8387116ae8c3e73f6184471f0c46edbd2c7601/Documentation/gitattributes.txt#L563-L564
+            # commit id is not cached as it changes with every commit
             yield gists.Gist(
               path=gist_file_path, 
               commit_id=git_commit_id,
-              tags=json.loads(gist_tags.replace('[[:space:]]',' ')) if gist_tags != 'set' else {},
+              tags=dir_gist['tags'],
               resources=[f'{str(gist_file_path.parent)}:**/*.*'],
               trace_id=str(gist_file_path),
               title=f'{gist_file_path.parent.name}-{gist_file_path.name}' )
+
+
+def changed_gists(
+  git: backends.GitBackend,
+  gsts: List[gists.Gist],
+  git_diff_hash: str) -> Iterator[gists.Gist]:
+    """Filter gists changed by git_diff_hash from previously located gists"""
+    logger = logging.getLogger()
+
+    git_diff_files = {Path(fc) for fc in git.diff_files(git_diff_hash)}
+
+    for gist in gsts:
+        if gist.path not in git_diff_files:
+            logger.info(f'{gist.path} unchanged for {git_diff_hash}')
+            continue
+
+        yield gist
@@ -5,46 +5,24 @@ Command line arguments for GistOps Operations
 import os
 import logging
 import json
-from functools import partial
 from pathlib import Path
-from typing import Callable, List
+from typing import List, Iterator
 
 import fire
 
-import gists
+from gistops_core import gists, logs
+
 import iterate
-import shell
+import backends
 import version
 
 
 class GistOps():
     """gistops - iterate gists stored in git"""
 
-    def __logs(self, logspath: Path, prefix: str='git-ls-attr'):
-        logspath.mkdir(parents=True, exist_ok=True)
-        datefmt='%Y-%m-%dT%H:%M:%SZ'
-
-        # Logs to gistops.log
-        logger = logging.getLogger()
-        logfile = logging.FileHandler(
-          logspath.joinpath(f'{prefix}.gistops.log'))
-        logfile.setFormatter(logging.Formatter(
-            f'{prefix},%(levelname)s,%(asctime)s,%(message)s', datefmt=datefmt ))
-        logger.addHandler(logfile)
-        logger.setLevel(os.environ.get('LOG_LEVEL','INFO'))
-        logger.info(version.__version__)
-
-        # Trailing to gistops.trail
-        traillog = logging.getLogger('gistops.trail')
-        traillogfile = logging.FileHandler(
-          logspath.joinpath(f'{prefix}.gistops.trail'))
-        traillogfile.setFormatter(logging.Formatter(
-            f'{prefix},%(levelname)s,%(asctime)s,%(message)s', datefmt=datefmt ))
-        traillog.addHandler(traillogfile)
-        traillog.setLevel(os.environ.get('LOG_LEVEL','INFO'))
-
-
-    def __init__(self, cwd: str = str( Path.cwd() ) ):
+    def __init__(self, 
+      cwd: str = str( Path.cwd() ),
+      git_backend: str = 'shell' ):
 
         ############
         # Git Root #
@@ -60,15 +38,17 @@ class GistOps():
         # Set logs path
         self.__gistops_path = self.__git_root.joinpath('.gistops')
         self.__gistops_path.mkdir(parents=True, exist_ok=True)
-        self.__logs(logspath=self.__gistops_path )
+        logs.init_logs(
+          logspath=self.__gistops_path,
+          prefix='git-ls-attr',
+          version=version.__version__)
 
-        #######################
-        # Pre-configure Shell #
-        #######################
-        self.__shrun: Callable[[List[str]], str] = partial(
-          shell.shrun,
-          env=os.environ,
-          cwd=self.__git_root.resolve()) 
+        #####################
+        # Pre-configure Git #
+        #####################
+        self.__git: backends.GitBackend = backends.connect(
+          git_backend=git_backend,
+          git_root=self.__git_root)
 
 
     def version(self) -> str:
@@ -76,30 +56,36 @@ class GistOps():
         return version.__version__
 
 
-    def list(self, git_hash: str = None) -> str:
-        """iterate gists in git"""
+    def list(self, git_hash: str = None, event_ndjson: str = None) -> str:
+        """iterate gists in git, streamed as ndjson to event_ndjson if given"""
 
         try:
+            # Locate all gists once ...
+            all_gsts: List[gists.Gist] = list(iterate.iterate_gists(
+              git=self.__git,
+              git_root=self.__git_root, 
+              gist_path=self.__gist_path,
+              index_path=self.__gistops_path.joinpath('git-ls-attr.index.json')))
+
             with open(
               self.__gistops_path.joinpath('gists.json'), 'w', encoding='utf-8') as gists_file:
                 gists_file.write(
-                  json.dumps( [gists.to_basic_dict(gist) for gist in iterate.iterate_gists(
-                    shrun=self.__shrun,
-                    git_root=self.__git_root, 
-                    gist_path=self.__gist_path, 
-                    git_diff_hash=None)] ) )
-
-            gsts: List[gists.Gist] = list()
-            for gist in iterate.iterate_gists(
-              shrun=self.__shrun,
-              git_root=self.__git_root, 
-              gist_path=self.__gist_path, 
-              git_diff_hash=git_hash):
+                  json.dumps( [gists.to_basic_dict(gist) for gist in all_gsts] ) )
+
+            # ... and derive the changed ones from them
+            def triggered_gists() -> Iterator[gists.Gist]:
+                for gist in all_gsts if git_hash is None else iterate.changed_gists(
+                  git=self.__git,
+                  gsts=all_gsts,
+                  git_diff_hash=git_hash):
+
+                    logging.getLogger('gistops.trail').info(f'{gist.trace_id},triggered')
+                    yield gist
 
-                gsts.append(gist)
-                logging.getLogger('gistops.trail').info(f'{gist.trace_id},triggered')
+            if event_ndjson is not None:
+                return gists.to_ndjson(triggered_gists(), Path(event_ndjson))
 
-            return gists.to_event(gsts)
+            return gists.to_event(list(triggered_gists()))
 
         except Exception as err:
             logging.getLogger('gistops.trail').error('*,unexpected error')
@@ -107,9 +93,9 @@ class GistOps():
             raise err
 
 
-    def run(self, git_hash: str = None) -> str:
+    def run(self, git_hash: str = None, event_ndjson: str = None) -> str:
         """iterate gists in git"""
-        return self.list(git_hash=git_hash)
+        return self.list(git_hash=git_hash, event_ndjson=event_ndjson)
 
 
 def main():
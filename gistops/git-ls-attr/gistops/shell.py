@@ -5,6 +5,7 @@ Functions to execute commands on the shell
 from typing import List
 from pathlib import Path
 import logging
+import subprocess
 
 from invoke.context import Context as InvokeContext
 from invoke.exceptions import UnexpectedExit
@@ -46,3 +47,33 @@ def shrun(
         logger.log(log_level,stdout)
 
     return stdout
+
+
+def shpipe(
+    cmd: List[str],
+    cwd: Path,
+    env: dict,
+    stdin: str = '',
+    log_level: int = logging.INFO) -> str:
+    """ Runs a command without shell and pipes stdin into it
+
+    Arguments are passed as is, i.e. MUST not be quoted for sh. 
+    Used for batched git commands (--stdin) which would otherwise 
+    require one process per path."""
+
+    logger = logging.getLogger()
+    logger.log(log_level,f'> {" ".join(cmd)} < ({len(stdin)} chars)')
+
+    try:
+        return subprocess.run(
+            cmd,
+            cwd=cwd,
+            env=env,
+            input=stdin,
+            capture_output=True,
+            encoding='utf-8',
+            check=True
+        ).stdout
+    except subprocess.CalledProcessError as err:
+        logger.log(log_level,err.stderr)
+        raise ShellError("unexpected exit") from err
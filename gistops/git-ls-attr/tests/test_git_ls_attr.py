@@ -7,15 +7,18 @@ import sys
 import zipfile
 import shutil
 import json
+import base64
 from pathlib import Path
 
 import pytest
 
+from gistops_core import gists
+
 sys.path.append(
   str(Path(os.path.realpath(__file__)).parent.parent.joinpath('gistops')))
 
-import gists
 import main
+import backends
 
 
 @pytest.fixture(scope="module", autouse=True)
@@ -85,3 +88,72 @@ def test_last_committed_gists_are_found():
         gists_json: list = json.loads(gists_json_file.read())
 
     assert len(gists_json) == 2
+
+
+def test_git_backends_find_same_gists():
+    """Tests in process git backend finds same gists as git commands"""
+    pytest.importorskip('pygit2')
+
+    shell_git = backends.connect(git_backend='shell', git_root=Path.cwd())
+    pygit2_git = backends.connect(git_backend='pygit2', git_root=Path.cwd())
+    assert shell_git.tree_oids() == pygit2_git.tree_oids()
+
+    for git_hash in [None, 'HEAD']:
+        shell_event_base64:str = main.GistOps(
+          cwd=str(Path.cwd()), git_backend='shell').list(git_hash=git_hash)
+
+        # ... resolve attributes again instead of reading them from index
+        Path.cwd().joinpath('.gistops').joinpath('git-ls-attr.index.json').unlink()
+        pygit2_event_base64:str = main.GistOps(
+          cwd=str(Path.cwd()), git_backend='pygit2').list(git_hash=git_hash)
+
+        assert shell_event_base64 == pygit2_event_base64
+
+
+def test_attribute_index_is_reused_and_invalidated():
+    """Tests resolved gists are cached and invalidated by parent .gitattributes"""
+
+    gistops_path = Path.cwd().joinpath('.gistops')
+    main.GistOps(cwd=str(Path.cwd())).list()
+    main.GistOps(cwd=str(Path.cwd())).list()
+
+    assert gistops_path.joinpath('git-ls-attr.index.json').exists()
+    with open(gistops_path.joinpath('git-ls-attr.gistops.log'),'r',encoding='utf-8') as log_file:
+        index_logs = [log for log in log_file.read().splitlines() if log.find('cache hits') >= 0]
+    assert index_logs[-1].endswith('4 cache hits and 0 cache misses')
+
+    # Change tags in parent directory of gists without committing
+    gitattributes_path = Path.cwd().joinpath('howtos').joinpath('.gitattributes')
+    with open(gitattributes_path,'r',encoding='utf-8') as gitattributes_file:
+        gitattributes = gitattributes_file.read()
+
+    try:
+        with open(gitattributes_path,'w',encoding='utf-8') as gitattributes_file:
+            gitattributes_file.write(
+              '**/README.md gistops={"jira":{"issue":"UCB-22","host":"verw.bssn.eu"}}')
+
+        event_base64:str = main.GistOps(cwd=str(Path.cwd())).list()
+        event: dict = json.loads(base64.b64decode(event_base64))
+
+        assert len(event['records']) == 2
+        for record in event['records']:
+            assert record['tags'] == {'jira':{'issue':'UCB-22','host':'verw.bssn.eu'}}
+
+    finally:
+        with open(gitattributes_path,'w',encoding='utf-8') as gitattributes_file:
+            gitattributes_file.write(gitattributes)
+
+
+def test_gists_are_streamed_as_ndjson():
+    """Tests ndjson event holds header line and same records as base64 event"""
+
+    event_base64:str = main.GistOps(cwd=str(Path.cwd())).list()
+    event_ndjson:str = main.GistOps(cwd=str(Path.cwd())).list(
+      event_ndjson=str(Path.cwd().joinpath('.gistops').joinpath('gists.ndjson')))
+
+    with open(event_ndjson,'r',encoding='utf-8') as event_ndjson_file:
+        ndjson_lines = event_ndjson_file.read().splitlines()
+
+    event: dict = json.loads(base64.b64decode(event_base64))
+    assert json.loads(ndjson_lines[0]) == {'semver':event['semver'],'record-type':'Gist'}
+    assert [json.loads(line) for line in ndjson_lines[1:]] == event['records']
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for git-ls-attr gistops image
+
+Run explicitly with
+> GISTOPS_BENCHMARK=1 python3 -m pytest -s tests/test_git_ls_attr_benchmark.py
+"""
+import os
+import sys
+import time
+import subprocess
+from pathlib import Path
+
+import pytest
+
+sys.path.append(
+  str(Path(os.path.realpath(__file__)).parent.parent.joinpath('gistops')))
+
+import iterate
+import backends
+
+
+pytestmark = pytest.mark.skipif(
+  os.environ.get('GISTOPS_BENCHMARK') is None,
+  reason='benchmarks only run if GISTOPS_BENCHMARK is set')
+
+
+def __synthetic_repository(repopath: Path, dirs: int, files: int) -> Path:
+    """Creates git repository with files evenly spread over dirs"""
+    repopath.mkdir(parents=True, exist_ok=True)
+
+    def git(*args: str):
+        subprocess.run(['git', *args], cwd=repopath, check=True, capture_output=True)
+
+    git('init', '--quiet')
+    git('config', 'user.name', 'gistops')
+    git('config', 'user.email', 'gistops@localhost')
+
+    with open(repopath.joinpath('.gitattributes'), 'w', encoding='utf-8') as attrs_file:
+        attrs_file.write('[attr]gistops\n')
+        attrs_file.write('**/README.md gistops={"confluence":{"page":"1","host":"localhost"}}\n')
+
+    for file_idx in range(files):
+        dir_path = repopath.joinpath(f'dir-{file_idx % dirs:05d}')
+        dir_path.mkdir(exist_ok=True)
+        file_name = 'README.md' if file_idx < dirs else f'file-{file_idx:06d}.txt'
+        with open(dir_path.joinpath(file_name), 'w', encoding='utf-8') as some_file:
+            some_file.write(f'{file_idx}\n')
+
+    git('add', '--all')
+    git('commit', '--quiet', '-m', 'synthetic')
+
+    return repopath
+
+
+def __iterate_gists_seconds(
+  repopath: Path, index_path: Path = None, git_backend: str = 'shell') -> float:
+    started = time.perf_counter()
+    gsts = list(iterate.iterate_gists(
+      git=backends.connect(git_backend=git_backend, git_root=repopath),
+      git_root=repopath,
+      gist_path=Path('.'),
+      index_path=index_path))
+    seconds = time.perf_counter() - started
+
+    assert len(gsts) > 0
+    return seconds
+
+
+@pytest.mark.parametrize('files', [100, 1000, 10000])
+def test_benchmark_check_attr_by_file_count(tmp_path: Path, files: int):
+    """Reports runtime of iterate_gists versus number of tracked files"""
+
+    repopath = __synthetic_repository(tmp_path.joinpath('repo'), dirs=10, files=files)
+    seconds = __iterate_gists_seconds(repopath)
+
+    print(f'\niterate_gists: {files} files in 10 dirs took {seconds:.3f}s')
+
+
+def test_benchmark_ls_files_10k_dirs_100k_files(tmp_path: Path):
+    """Reports runtime of iterate_gists on a large synthetic repository"""
+
+    repopath = __synthetic_repository(tmp_path.joinpath('repo'), dirs=10000, files=100000)
+    seconds = __iterate_gists_seconds(repopath)
+
+    print(f'\niterate_gists: 100000 files in 10000 dirs took {seconds:.3f}s')
+
+
+def test_benchmark_attribute_index_10k_dirs_100k_files(tmp_path: Path):
+    """Reports runtime of iterate_gists with cold and warm attribute index"""
+
+    repopath = __synthetic_repository(tmp_path.joinpath('repo'), dirs=10000, files=100000)
+    index_path = tmp_path.joinpath('git-ls-attr.index.json')
+
+    cold_seconds = __iterate_gists_seconds(repopath, index_path=index_path)
+    warm_seconds = __iterate_gists_seconds(repopath, index_path=index_path)
+
+    print(f'\niterate_gists: 100000 files in 10000 dirs took {cold_seconds:.3f}s '
+      f'with cold and {warm_seconds:.3f}s with warm attribute index')
+
+
+def test_benchmark_git_backends_10k_dirs_100k_files(tmp_path: Path):
+    """Reports runtime of iterate_gists per git backend"""
+    pytest.importorskip('pygit2')
+
+    repopath = __synthetic_repository(tmp_path.joinpath('repo'), dirs=10000, files=100000)
+
+    for git_backend in ['shell', 'pygit2']:
+        seconds = __iterate_gists_seconds(repopath, git_backend=git_backend)
+        print(f'\niterate_gists: 100000 files in 10000 dirs took {seconds:.3f}s '
+          f'with {git_backend} git backend')
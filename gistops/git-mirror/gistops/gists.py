@@ -1,37 +0,0 @@
-#!/usr/bin/env python3
-"""
-Gist Representation and Factories
-"""
-from pathlib import Path
-
-##################
-# EXPORTED TYPES #
-##################
-class GistOpsError(Exception):
-    """ GistOps representation error """
-
-######################
-# EXPORTED FUNCTIONS #
-######################
-def assert_git_root(gist_absolute_path: Path) -> Path:
-    """Locate git root directory from gist_path"""
-    if not gist_absolute_path.exists():
-        raise GistOpsError(f'{gist_absolute_path} does not exist')
-
-    def traverse_upwards(gist_path: Path) -> Path:
-        if gist_path == gist_path.parent:
-            return None
-
-        if gist_path.is_dir():
-            if len(list(gist_path.glob('.git'))) == 1:
-                return gist_path
-
-        return traverse_upwards(gist_path.parent)
-
-    git_root_path = traverse_upwards(gist_absolute_path.resolve())
-    if not git_root_path:
-        raise GistOpsError(
-            f'{gist_absolute_path} is not in a git repository. '
-            'Please run from valid git repository')
-
-    return git_root_path
@@ -10,7 +10,8 @@ from typing import Callable, List
 
 import fire
 
-import gists
+from gistops_core import gists, logs
+
 import shell
 import mirroring
 import version
@@ -20,30 +21,6 @@ class GistOps():
     """gistops - Operations on Gists managed by Git"""
 
 
-    def __logs(self, logspath: Path, prefix: str='git-mirror'):
-        logspath.mkdir(parents=True, exist_ok=True)
-        datefmt='%Y-%m-%dT%H:%M:%SZ'
-
-        # Logs to gistops.log
-        logger = logging.getLogger()
-        logfile = logging.FileHandler(
-          logspath.joinpath(f'{prefix}.gistops.log'))
-        logfile.setFormatter(logging.Formatter(
-            f'{prefix},%(levelname)s,%(asctime)s,%(message)s', datefmt=datefmt ))
-        logger.addHandler(logfile)
-        logger.setLevel(os.environ.get('LOG_LEVEL','INFO'))
-        logger.info(version.__version__)
-
-        # Trailing to gistops.trail
-        traillog = logging.getLogger('gistops.trail')
-        traillogfile = logging.FileHandler(
-          logspath.joinpath(f'{prefix}.gistops.trail'))
-        traillogfile.setFormatter(logging.Formatter(
-            f'{prefix},%(levelname)s,%(asctime)s,%(message)s', datefmt=datefmt ))
-        traillog.addHandler(traillogfile)
-        traillog.setLevel(os.environ.get('LOG_LEVEL','INFO'))
-
-
     def __init__(self, 
       cwd: str = str(Path.cwd()),
       dry_run: bool = False ):
@@ -59,7 +36,10 @@ class GistOps():
 
         self.__gistops_path = self.__git_root.joinpath('.gistops')
         self.__gistops_path.mkdir(parents=True, exist_ok=True)
-        self.__logs( logspath=self.__gistops_path )
+        logs.init_logs(
+          logspath=self.__gistops_path,
+          prefix='git-mirror',
+          version=version.__version__)
 
         #######################
         # Pre-configure Shell #
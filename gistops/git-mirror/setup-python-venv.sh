@@ -7,6 +7,7 @@ python3 -m venv ./venv
 
 source ./venv/bin/activate
 
+python3 -m pip install -e ../core
 python3 -m pip install -r requirements.txt
 python3 -m pip install pylint
 python3 -m pip install pytest
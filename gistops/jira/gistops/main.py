@@ -9,7 +9,8 @@ from typing import Union, List
 
 import fire
 
-import gists
+from gistops_core import gists, logs
+
 import publishing
 import version
 
@@ -18,30 +19,6 @@ class GistOps():
     """gistops - Publish gists as pages to Confluence"""
 
 
-    def __logs(self, logspath: Path, prefix: str='jira'):
-        logspath.mkdir(parents=True, exist_ok=True)
-        datefmt='%Y-%m-%dT%H:%M:%SZ'
-
-        # Logs to gistops.log
-        logger = logging.getLogger()
-        logfile = logging.FileHandler(
-          logspath.joinpath(f'{prefix}.gistops.log'))
-        logfile.setFormatter(logging.Formatter(
-            f'{prefix},%(levelname)s,%(asctime)s,%(message)s', datefmt=datefmt ))
-        logger.addHandler(logfile)
-        logger.setLevel(os.environ.get('LOG_LEVEL','INFO'))
-        logger.info(version.__version__)
-
-        # Trailing to gistops.trail
-        traillog = logging.getLogger('gistops.trail')
-        traillogfile = logging.FileHandler(
-          logspath.joinpath(f'{prefix}.gistops.trail'))
-        traillogfile.setFormatter(logging.Formatter(
-            f'{prefix},%(levelname)s,%(asctime)s,%(message)s', datefmt=datefmt ))
-        traillog.addHandler(traillogfile)
-        traillog.setLevel(os.environ.get('LOG_LEVEL','INFO'))
-
-
     def __init__(self, 
       cwd: str = str(Path.cwd()), 
       dry_run: bool = False ):
@@ -57,7 +34,10 @@ class GistOps():
 
         self.__gistops_path = self.__git_root.joinpath('.gistops')
         self.__gistops_path.mkdir(parents=True, exist_ok=True)
-        self.__logs( logspath=self.__gistops_path )
+        logs.init_logs(
+          logspath=self.__gistops_path,
+          prefix='jira',
+          version=version.__version__)
 
         #######################
         # Pre-configure Shell #
@@ -115,23 +95,26 @@ class GistOps():
                 eb64s = [event_base64] 
             else:
                 raise gists.GistOpsError(
-                  'event_base64 must bei either single base64 encoded event ' 
-                  'or list of base64 encoded events')
+                  'event_base64 must bei either single base64 encoded event, ' 
+                  'ndjson event file or list of those')
 
             jira = self.__jira_api(jira_url, jira_access_token, jira_username, jira_password)
 
             failed: List(str) = []
             for eb64 in eb64s:
-                try:
-                    if Path(eb64).exists() and Path(eb64).is_file():
-                        with open(Path(eb64), 'r', encoding='utf-8') as event_base64_file:
-                            eb64 = event_base64_file.read()
-                except OSError:
-                    pass # e.g. filename to long for base64
-
-                for gist in sorted(
-                  gists.from_event(eb64),
-                  key=lambda g: 0 if g.path.suffix == '.jira' else 1 ):
+                # Pages are published while streaming, attachments
+                # are deferred until all pages of the event exist
+                attachments: List[gists.Gist] = []
+                for gist in gists.read_event(eb64):
+                    if gist.path.suffix != '.jira':
+                        attachments.append(gist)
+                        continue
+
+                    if not publishing.publish(
+                      jira = jira, gist = gist, dry_run = self.__dry_run):
+                        failed.append(gist.trace_id)
+
+                for gist in attachments:
                     if not publishing.publish(
                       jira = jira, gist = gist, dry_run = self.__dry_run):
                         failed.append(gist.trace_id)
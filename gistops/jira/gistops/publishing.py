@@ -14,7 +14,7 @@ from jsonschema import validate
 from jsonschema.exceptions import ValidationError
 from atlassian import Jira
 
-import gists
+from gistops_core import gists
 
 
 @dataclass
@@ -14,7 +14,7 @@ from traitlets.config import Config
 from nbconvert import MarkdownExporter, HTMLExporter
 from nbconvert.preprocessors import ExecutePreprocessor
 
-import gists
+from gistops_core import gists
 
 
 def __render_html(
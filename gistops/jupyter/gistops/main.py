@@ -5,11 +5,12 @@ Command line arguments for GistOps Operations
 import os
 import logging
 from pathlib import Path
-from typing import List, Union
+from typing import Iterator, List, Union
 
 import fire
 
-import gists
+from gistops_core import gists, logs
+
 import version
 import extract
 
@@ -18,30 +19,6 @@ class GistOps():
     """gistops - Extract static reports from jupyter notebooks"""
 
 
-    def __logs(self, logspath: Path, prefix: str='jupyter'):
-        logspath.mkdir(parents=True, exist_ok=True)
-        datefmt='%Y-%m-%dT%H:%M:%SZ'
-
-        # Logs to gistops.log
-        logger = logging.getLogger()
-        logfile = logging.FileHandler(
-          logspath.joinpath(f'{prefix}.gistops.log'))
-        logfile.setFormatter(logging.Formatter(
-            f'{prefix},%(levelname)s,%(asctime)s,%(message)s', datefmt=datefmt ))
-        logger.addHandler(logfile)
-        logger.setLevel(os.environ.get('LOG_LEVEL','INFO'))
-        logger.info(version.__version__)
-
-        # Trailing to gistops.trail
-        traillog = logging.getLogger('gistops.trail')
-        traillogfile = logging.FileHandler(
-          logspath.joinpath(f'{prefix}.gistops.trail'))
-        traillogfile.setFormatter(logging.Formatter(
-            f'{prefix},%(levelname)s,%(asctime)s,%(message)s', datefmt=datefmt ))
-        traillog.addHandler(traillogfile)
-        traillog.setLevel(os.environ.get('LOG_LEVEL','INFO'))
-
-
     def __init__(self, cwd: str = str(Path.cwd())):
 
         ############
@@ -55,7 +32,10 @@ class GistOps():
 
         self.__gistops_path = self.__git_root.joinpath('.gistops')
         self.__gistops_path.mkdir(parents=True, exist_ok=True)
-        self.__logs( logspath=self.__gistops_path )
+        logs.init_logs(
+          logspath=self.__gistops_path,
+          prefix='jupyter',
+          version=version.__version__)
 
 
     def version(self) -> str:
@@ -65,8 +45,9 @@ class GistOps():
 
     def extract(self, 
       event_base64: Union[str,list], 
-      outpath: str = '.gistops/data'):
-        """Extract static reports from jupyter notebooks"""
+      outpath: str = '.gistops/data',
+      event_ndjson: str = None):
+        """Extract static reports from jupyter notebooks, streamed as ndjson to event_ndjson if given"""
 
         try:
             if isinstance(event_base64, list):
@@ -75,8 +56,8 @@ class GistOps():
                 eb64s = [event_base64] 
             else:
                 raise gists.GistOpsError(
-                  'event_base64 must bei either single base64 encoded event ' 
-                  'or list of base64 encoded events')
+                  'event_base64 must bei either single base64 encoded event, ' 
+                  'ndjson event file or list of those')
 
             try:
                 outpath = Path(outpath).resolve().relative_to(self.__git_root.resolve())
@@ -85,45 +66,45 @@ class GistOps():
                   'output path MUST be sub directory of git root'
                   'in order to be accessable from downstream ops') from err
 
-            nbs: List[gists.Gist] = []
             failed: List[str] = []
-            for eb64 in eb64s:
-                try:
-                    if Path(eb64).exists() and Path(eb64).is_file():
-                        with open(Path(eb64), 'r', encoding='utf-8') as event_base64_file:
-                            eb64 = event_base64_file.read()
-                except OSError:
-                    pass # e.g. filename to long for base64
-
-                
-                for gist in gists.from_event(eb64):
-                    if gist.path.suffix != '.ipynb':
-                        continue # ... skip non .ipynb files
-
-                    try:
-                        # Check if gist is already relative to outpath
+            def extracted_gists() -> Iterator[gists.Gist]:
+                for eb64 in eb64s:
+                    for gist in gists.read_event(eb64):
+                        if gist.path.suffix != '.ipynb':
+                            continue # ... skip non .ipynb files
+
                         try:
-                            gist.path.relative_to(Path(outpath))
-                            gist_outpath=Path('.')
-                        except ValueError:
-                            gist_outpath=Path(outpath)
-
-                        nbs.extend( extract.extract(
-                          gist = gist,
-                          outpath = gist_outpath) )
-
-                        logging.getLogger('gistops.trail').info(f'{gist.path},converted')
-
-                    except Exception as err:
-                        logging.getLogger('gistops.trail').error(f'{gist.path},convertion failed')
-                        logging.getLogger().error(err, exc_info=True)
-                        failed.append(gist.trace_id)
-                    
+                            # Check if gist is already relative to outpath
+                            try:
+                                gist.path.relative_to(Path(outpath))
+                                gist_outpath=Path('.')
+                            except ValueError:
+                                gist_outpath=Path(outpath)
+
+                            nbs = extract.extract(
+                              gist = gist,
+                              outpath = gist_outpath)
+
+                            logging.getLogger('gistops.trail').info(f'{gist.path},converted')
+
+                        except Exception as err:
+                            logging.getLogger('gistops.trail').error(f'{gist.path},convertion failed')
+                            logging.getLogger().error(err, exc_info=True)
+                            failed.append(gist.trace_id)
+                            continue
+
+                        yield from nbs
+
+            if event_ndjson is not None:
+                event = gists.to_ndjson(extracted_gists(), Path(event_ndjson))
+            else:
+                event = gists.to_event(list(extracted_gists()))
+
             if len(failed) > 0:
                 raise gists.GistOpsError(
                   f'Failed to convert ipynb {failed}, see previous errors')
 
-            return gists.to_event( nbs )
+            return event
       
         except Exception as err:
             logging.getLogger('gistops.trail').error('*,unexpected error')
@@ -133,12 +114,14 @@ class GistOps():
 
     def run(self, 
       event_base64: Union[str,list],
-      outpath: str = '.gistops/data') -> str:
+      outpath: str = '.gistops/data',
+      event_ndjson: str = None) -> str:
         """Extract static reports from jupyter notebooks"""
 
         return self.extract(
             event_base64=event_base64, 
-            outpath=outpath)
+            outpath=outpath,
+            event_ndjson=event_ndjson)
 
 
 def main():
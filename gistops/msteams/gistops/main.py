@@ -3,12 +3,12 @@
 Command line arguments for GistOps Operations
 """
 import os
-import logging
 from pathlib import Path
 
 import fire
 
-import gists
+from gistops_core import gists, logs
+
 import trails
 import reporting
 import version
@@ -18,21 +18,6 @@ class GistOps():
     """gistops - msteams notification"""
 
 
-    def __logs(self, logspath: Path, prefix: str='msteams'):
-        logspath.mkdir(parents=True, exist_ok=True)
-        datefmt='%Y-%m-%dT%H:%M:%SZ'
-
-        # Logs to gistops.log
-        logger = logging.getLogger()
-        logfile = logging.FileHandler(
-          logspath.joinpath(f'{prefix}.gistops.log'))
-        logfile.setFormatter(logging.Formatter(
-            f'{prefix},%(levelname)s,%(asctime)s,%(message)s', datefmt=datefmt ))
-        logger.addHandler(logfile)
-        logger.setLevel(os.environ.get('LOG_LEVEL','INFO'))
-        logger.info(version.__version__)
-
-
     def __init__(self, cwd: str = str(Path.cwd())):
 
         ############
@@ -47,7 +32,11 @@ class GistOps():
 
         self.__gistops_path = self.__git_root.joinpath('.gistops')
         self.__gistops_path.mkdir(parents=True, exist_ok=True)
-        self.__logs( logspath=self.__gistops_path )
+        logs.init_logs(
+          logspath=self.__gistops_path,
+          prefix='msteams',
+          version=version.__version__,
+          trail=False)
 
 
     def version(self) -> str:
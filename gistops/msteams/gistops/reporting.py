@@ -11,8 +11,9 @@ from typing import List
 
 from jinja2 import BaseLoader, Environment
 
+from gistops_core import gists
+
 import trails
-import gists
 
 
 __TRAILLOG_TEMPLATE_J2 = '''
@@ -8,7 +8,7 @@ from datetime import datetime
 from dataclasses import dataclass
 import logging
 
-import gists
+from gistops_core import gists
 
 
 @dataclass
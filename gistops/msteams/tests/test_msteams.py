@@ -14,12 +14,13 @@ from jsonschema import validate
 import pytest
 from bs4 import BeautifulSoup
 
+from gistops_core import gists
+
 sys.path.append(
   str(Path(os.path.realpath(__file__)).parent.parent.joinpath('gistops')))
 
 import main
 import reporting
-import gists
 
 
 @pytest.fixture(scope="module", autouse=True)
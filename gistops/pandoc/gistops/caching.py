@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Content addressed cache of pandoc outputs
+"""
+import os
+import shutil
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from dataclasses import dataclass, field
+from typing import Iterable
+
+
+##################
+# EXPORTED TYPES #
+##################
+@dataclass
+class ConversionCache:
+    """Pandoc outputs keyed by the content of everything pandoc reads"""
+    path: Path
+    max_bytes: int
+    pandoc_version: str
+    hits: int = 0
+    misses: int = 0
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+#####################
+# PRIVATE FUNCTIONS #
+#####################
+def __entry_path(cache: ConversionCache, key: str) -> Path:
+    return cache.path.joinpath(key[:2]).joinpath(key)
+
+
+def __count(cache: ConversionCache, hit: bool):
+    with cache.lock: # ... conversions may run on several jobs
+        if hit:
+            cache.hits += 1
+        else:
+            cache.misses += 1
+
+
+######################
+# EXPORTED FUNCTIONS #
+######################
+def load(cache_path: Path, max_bytes: int, pandoc_version: str) -> ConversionCache:
+    """Open cache in cache_path, entries are kept until max_bytes are exceeded"""
+    cache_path.mkdir(parents=True, exist_ok=True)
+    return ConversionCache(
+      path=cache_path,
+      max_bytes=max_bytes,
+      pandoc_version=pandoc_version)
+
+
+def digest(
+  cache: ConversionCache,
+  source_path: Path,
+  pandoc_yml: str,
+  resource_paths: Iterable[Path]) -> str:
+    """Key of a conversion from source, rendered defaults, resources and pandoc version"""
+    key = hashlib.sha256()
+    for part in [cache.pandoc_version, str(source_path), pandoc_yml]:
+        key.update(part.encode('utf-8'))
+        key.update(b'\0')
+
+    with open(source_path, 'rb') as source_file:
+        key.update(hashlib.sha256(source_file.read()).digest())
+
+    for resource_path in sorted(resource_paths, key=str):
+        with open(resource_path, 'rb') as resource_file:
+            key.update(str(resource_path).encode('utf-8'))
+            key.update(hashlib.sha256(resource_file.read()).digest())
+
+    return key.hexdigest()
+
+
+def lookup(cache: ConversionCache, key: str, output_filepath: Path) -> bool:
+    """Materialize cached output at output_filepath, False if not cached"""
+    entry_path = __entry_path(cache, key)
+    try:
+        shutil.copyfile(entry_path, output_filepath)
+        os.utime(entry_path) # ... least recently used is evicted first
+    except OSError:
+        __count(cache, hit=False)
+        return False
+
+    __count(cache, hit=True)
+    return True
+
+
+def update(cache: ConversionCache, key: str, output_filepath: Path):
+    """Stores output of a conversion under key"""
+    entry_path = __entry_path(cache, key)
+    entry_path.parent.mkdir(parents=True, exist_ok=True)
+
+    # Write aside and rename, jobs may store the same key at once
+    partial_path = entry_path.with_name(f'{key}.{threading.get_ident()}.partial')
+    shutil.copyfile(output_filepath, partial_path)
+    os.replace(partial_path, entry_path)
+
+
+def store(cache: ConversionCache):
+    """Evict least recently used entries until cache fits into max_bytes"""
+    logger = logging.getLogger()
+
+    entries = []
+    for entry_path in cache.path.glob('*/*'):
+        try:
+            entry_stat = entry_path.stat()
+        except OSError:
+            continue # ... removed meanwhile
+        entries.append((entry_stat.st_mtime, entry_stat.st_size, entry_path))
+
+    cached_bytes = sum(size for _, size, _ in entries)
+    for _, size, entry_path in sorted(entries, key=lambda entry: entry[0]):
+        if cached_bytes <= cache.max_bytes:
+            break
+        entry_path.unlink(missing_ok=True)
+        cached_bytes -= size
+
+    logger.info(
+      f'Conversion cache {cache.path} used with {cache.hits} cache hits '
+      f'and {cache.misses} cache misses, {cached_bytes} bytes cached')
@@ -2,27 +2,68 @@
 """
 Functions to render gists using Pandoc
 """
+import os
+import copy
 import logging
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from pathlib import Path
-from functools import wraps
-from typing import Callable, List, Any
+from functools import lru_cache, wraps
+from typing import Callable, Deque, Dict, Iterable, Iterator, List, Any, Set, Tuple
 
 import yaml
-from jinja2 import BaseLoader, Environment
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+
+from gistops_core import gists
 
 import shell
-import gists
+import caching
+
+
+__GITIGNORE_LOCK = threading.Lock()
+
+
+__PANDOC_J2_PATHS: Dict[Path, Tuple[int, List[Path]]] = {}
+
+
+def __pandoc_j2_paths(gist_dir: Path) -> List[Path]:
+    """*.pandoc.j2 of a directory, listed again only if the directory changed"""
+    dir_mtime = gist_dir.stat().st_mtime_ns
+    cached = __PANDOC_J2_PATHS.get(gist_dir)
+    if cached is None or cached[0] != dir_mtime:
+        cached = (dir_mtime, sorted(list(gist_dir.glob('*.pandoc.j2')), key=str))
+        __PANDOC_J2_PATHS[gist_dir] = cached
+
+    return cached[1]
+
+
+@lru_cache(maxsize=None)
+def __j2_environment(git_root: str) -> Environment:
+    """One environment per git root, templates are compiled once per path and mtime"""
+    bytecode_path = Path(git_root).joinpath('.gistops').joinpath('cache').joinpath('jinja2')
+    bytecode_path.mkdir(parents=True, exist_ok=True)
 
+    return Environment(
+      loader=FileSystemLoader(git_root),
+      bytecode_cache=FileSystemBytecodeCache(str(bytecode_path)),
+      auto_reload=True)
 
-def __render_j2(gist:gists.Gist, pandoc_j2_path: Path) -> dict:
-    # Render pandoc config
-    with open(pandoc_j2_path, 'r', encoding='utf-8') as pandoc_j2_file:
-        pandoc_j2_tmpl = Environment(loader=BaseLoader()).from_string(
-          pandoc_j2_file.read())
-        pandoc_yml_str: str = pandoc_j2_tmpl.render( gists.j2_params(gist) )
+
+@lru_cache(maxsize=1024)
+def __load_yml(pandoc_yml_str: str) -> Tuple[dict, str]:
+    """Parsed and normalized pandoc defaults, gists often render the same text"""
+    pandoc_yml: dict = yaml.safe_load(pandoc_yml_str)
+    return pandoc_yml, yaml.dump(pandoc_yml)
+
+
+def __render_j2(gist:gists.Gist, pandoc_j2_path: Path) -> Tuple[dict, str]:
+    # Render pandoc config, template paths are relative to git root
+    pandoc_j2_tmpl = __j2_environment(os.getcwd()).get_template(pandoc_j2_path.as_posix())
+    pandoc_yml_str: str = pandoc_j2_tmpl.render( gists.j2_params(gist) )
 
     try:
-        pandoc_yml: dict = yaml.safe_load(pandoc_yml_str)
+        pandoc_yml, pandoc_yml_dump = __load_yml(pandoc_yml_str)
     except yaml.YAMLError as err:
         raise gists.GistOpsError(
           f'Pandoc configuration {pandoc_j2_path} is invalid') from err
@@ -33,7 +74,8 @@ def __render_j2(gist:gists.Gist, pandoc_j2_path: Path) -> dict:
           f'Required "to" and/or "from" option not found in configuration {pandoc_j2_path}'
           'See --to or --from option in https://pandoc.org/MANUAL.html')
 
-    return pandoc_yml
+    # ... memoized defaults are shared between gists
+    return copy.deepcopy(pandoc_yml), pandoc_yml_dump
 
 
 def __ensure_gitignore(
@@ -62,26 +104,64 @@ def __gitignore_new(func):
         gist: gists.Gist = \
              args[1] if len(args) > 0 else kwargs['gist']
 
-        pre_existing = list(gist.path.parent.iterdir())
+        # ... names only, directories may hold thousands of gists
+        pre_existing = set(os.listdir(gist.path.parent))
         
         try:
             return func(*args, **kwargs)
         finally:
-            for ignore_candidate in gist.path.parent.iterdir():
-                if ignore_candidate in pre_existing:
-                    continue
-
-                if ignore_candidate.is_file():
-                    ignore_pattern = ignore_candidate.name
-                elif ignore_candidate.is_dir():
-                    ignore_pattern = f'{ignore_candidate.name}/'
-                
-                __ensure_gitignore(
-                  shrun, gist.path.parent, ignore_pattern)
+            # ... check and append of .gitignore must not interleave between jobs
+            with __GITIGNORE_LOCK:
+                for ignore_name in os.listdir(gist.path.parent):
+                    if ignore_name in pre_existing:
+                        continue
+
+                    ignore_candidate = gist.path.parent.joinpath(ignore_name)
+
+                    if ignore_candidate.is_file():
+                        ignore_pattern = ignore_candidate.name
+                    elif ignore_candidate.is_dir():
+                        ignore_pattern = f'{ignore_candidate.name}/'
+
+                    __ensure_gitignore(
+                      shrun, gist.path.parent, ignore_pattern)
 
     return decorator_func
 
 
+def __convert_after(
+  previous: Future,
+  shrun: Callable[[List[str]], str],
+  gist: gists.Gist,
+  outpath: Path,
+  dry_run: bool,
+  cache: caching.ConversionCache) -> List[gists.Gist]:
+    if previous is not None:
+        wait([previous]) # ... regardless of whether it failed
+    return convert(shrun=shrun, gist=gist, outpath=outpath, dry_run=dry_run, cache=cache)
+
+
+def __resource_files(
+  gist: gists.Gist,
+  pandoc_yml: dict,
+  generated: Set[Path]) -> List[Path]:
+    """Files pandoc may embed from resource-path, except files written by conversions"""
+    resource_files: List[Path] = []
+    for resource_dir in pandoc_yml.get('resource-path', []):
+        resource_dir_path = gist.path.parent.joinpath(resource_dir)
+        if not resource_dir_path.is_dir():
+            continue
+
+        for resource_path in resource_dir_path.iterdir():
+            if resource_path.name.startswith('.') or not resource_path.is_file():
+                continue # ... e.g. .gitignore updated by __gitignore_new
+            if resource_path in generated or resource_path == gist.path:
+                continue
+            resource_files.append(resource_path)
+
+    return resource_files
+
+
 def __supported_pandoc_format_to_ext(pandoc_format: str) -> str:
     try:
         # See https://pandoc.org/MANUAL.html for a list of all formats
@@ -105,17 +185,25 @@ def convert(
   shrun: Callable[[List[str]], str], 
   gist: gists.Gist,
   outpath: Path,
-  dry_run: bool = False) -> List[gists.Gist]:
-    """Convert gists using pandoc configurations""" 
+  dry_run: bool = False,
+  cache: caching.ConversionCache = None) -> List[gists.Gist]:
+    """Convert gists using pandoc configurations, reusing cached outputs if given""" 
     logger = logging.getLogger()
 
-    convs: List[gists.Gist] = []
-    for pandoc_j2_path in sorted(
-      list(gist.path.parent.glob('*.pandoc.j2')), 
-      key=str):
+    # Render pandoc configs
+    pandoc_ymls: List[Tuple[Path, dict, str]] = [
+      (pandoc_j2_path, *__render_j2(gist, pandoc_j2_path))
+      for pandoc_j2_path in __pandoc_j2_paths(gist.path.parent) ]
 
-        # Render pandoc config
-        pandoc_yml = __render_j2(gist, pandoc_j2_path)
+    # ... outputs of conversions are no resources of conversions
+    generated: Set[Path] = set()
+    for pandoc_j2_path, pandoc_yml, _ in pandoc_ymls:
+        outdir = outpath.joinpath(pandoc_j2_path.parent)
+        generated.add(outdir.joinpath(f'{pandoc_j2_path.stem}.yml'))
+        generated.add(outdir.joinpath(f'{gist.path.stem}.{pandoc_yml["to"]}'))
+
+    convs: List[gists.Gist] = []
+    for pandoc_j2_path, pandoc_yml, pandoc_yml_str in pandoc_ymls:
 
         # Write pandoc defaults to disk
         pandoc_yml_path = outpath.joinpath(pandoc_j2_path.parent).joinpath(
@@ -125,7 +213,7 @@ def convert(
         if not dry_run:
             pandoc_yml_path.parent.mkdir(parents=True, exist_ok=True)
             with open(pandoc_yml_path,'w',encoding='utf-8') as pandoc_yml_file:
-                pandoc_yml_file.write( yaml.dump(pandoc_yml) )
+                pandoc_yml_file.write( pandoc_yml_str )
 
         # Get stem from pandoc format
         from_ext: str = __supported_pandoc_format_to_ext(pandoc_yml["from"])
@@ -146,6 +234,14 @@ def convert(
         output_filepath = outpath.joinpath(pandoc_j2_path.parent).joinpath(
           f'{gist.path.stem}.{pandoc_yml["to"]}') 
 
+        cache_key: str = None
+        if cache is not None and not dry_run:
+            cache_key = caching.digest(
+              cache,
+              source_path=gist.path,
+              pandoc_yml=pandoc_yml_str,
+              resource_paths=__resource_files(gist, pandoc_yml, generated))
+
         if output_filepath.exists():
             logger.info(f'> rm {output_filepath} ')
             if not dry_run:
@@ -153,13 +249,20 @@ def convert(
 
         if not dry_run:
             output_filepath.parent.mkdir(parents=True, exist_ok=True)
-        shrun(
-          cmd=[
-            'pandoc',f'"{str(gist.path)}"',
-            '-d', f'"{str(pandoc_yml_path)}"', 
-            '-o', f'"{str(output_filepath)}"',
-            f'--resource-path="{gist.path.parent}"'],
-          do_not_execute=dry_run)
+
+        if cache_key is not None and caching.lookup(cache, cache_key, output_filepath):
+            logger.info(f'> cp "{cache.path}/{cache_key[:2]}/{cache_key}" "{output_filepath}"')
+        else:
+            shrun(
+              cmd=[
+                'pandoc',f'"{str(gist.path)}"',
+                '-d', f'"{str(pandoc_yml_path)}"', 
+                '-o', f'"{str(output_filepath)}"',
+                f'--resource-path="{gist.path.parent}"'],
+              do_not_execute=dry_run)
+
+            if cache_key is not None:
+                caching.update(cache, cache_key, output_filepath)
 
         if 'metadata' in pandoc_yml and 'title' in pandoc_yml['metadata']:
             title = pandoc_yml['metadata']['title']
@@ -178,6 +281,34 @@ def convert(
     return convs
 
 
+def convert_all(
+  shrun: Callable[[List[str]], str],
+  gists_outpaths: Iterable[Tuple[gists.Gist, Path]],
+  dry_run: bool = False,
+  jobs: int = 1,
+  cache: caching.ConversionCache = None) -> Iterator[Tuple[gists.Gist, Future]]:
+    """Convert gists on up to jobs threads, yields every gist with its pending
+    conversion in given order. Gists sharing an output directory are converted
+    one after another as they share pandoc defaults and .gitignore files"""
+    if jobs < 1:
+        raise gists.GistOpsError(f'jobs must be at least 1, got {jobs}')
+
+    with ThreadPoolExecutor(max_workers=jobs, thread_name_prefix='pandoc') as pool:
+        pending: Deque[Tuple[gists.Gist, Future]] = deque()
+        last_of_outdir: Dict[Path, Future] = {}
+        for gist, outpath in gists_outpaths:
+            outdir = Path(os.path.normpath(outpath.joinpath(gist.path.parent)))
+            conversion = pool.submit(__convert_after,
+              last_of_outdir.get(outdir), shrun, gist, outpath, dry_run, cache)
+            last_of_outdir[outdir] = conversion
+            pending.append((gist, conversion))
+
+            while len(pending) > 2 * jobs:
+                yield pending.popleft() # ... keep the pool busy while streaming
+
+        yield from pending
+
+
 def cleanup(
   gist: gists.Gist, 
   outpath: Path,
@@ -188,7 +319,7 @@ def cleanup(
     for pandoc_j2_path in gist.path.parent.glob('*.pandoc.j2'):
 
         # Render pandoc config
-        pandoc_yml = __render_j2(gist, pandoc_j2_path)
+        pandoc_yml, _ = __render_j2(gist, pandoc_j2_path)
 
         # Delete converted files
         pandoc_yml_path = outpath.joinpath(pandoc_j2_path.parent).joinpath(
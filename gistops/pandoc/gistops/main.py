@@ -6,12 +6,14 @@ import os
 import logging
 from functools import partial
 from pathlib import Path
-from typing import Callable, List, Union
+from typing import Callable, Dict, Iterator, List, Tuple, Union
 
 import fire
 
-import gists
+from gistops_core import gists, logs
+
 import shell
+import caching
 import converting
 import version
 
@@ -20,30 +22,6 @@ class GistOps():
     """gistops - Operations on Gists managed by Git"""
 
 
-    def __logs(self, logspath: Path, prefix: str='pandoc'):
-        logspath.mkdir(parents=True, exist_ok=True)
-        datefmt='%Y-%m-%dT%H:%M:%SZ'
-
-        # Logs to gistops.log
-        logger = logging.getLogger()
-        logfile = logging.FileHandler(
-          logspath.joinpath(f'{prefix}.gistops.log'))
-        logfile.setFormatter(logging.Formatter(
-            f'{prefix},%(levelname)s,%(asctime)s,%(message)s', datefmt=datefmt ))
-        logger.addHandler(logfile)
-        logger.setLevel(os.environ.get('LOG_LEVEL','INFO'))
-        logger.info(version.__version__)
-
-        # Trailing to gistops.trail
-        traillog = logging.getLogger('gistops.trail')
-        traillogfile = logging.FileHandler(
-          logspath.joinpath(f'{prefix}.gistops.trail'))
-        traillogfile.setFormatter(logging.Formatter(
-            f'{prefix},%(levelname)s,%(asctime)s,%(message)s', datefmt=datefmt ))
-        traillog.addHandler(traillogfile)
-        traillog.setLevel(os.environ.get('LOG_LEVEL','INFO'))
-
-
     def __init__(self, 
       cwd: str = str(Path.cwd()),
       dry_run: bool = False):
@@ -59,7 +37,10 @@ class GistOps():
 
         self.__gistops_path = self.__git_root.joinpath('.gistops')
         self.__gistops_path.mkdir(parents=True, exist_ok=True)
-        self.__logs( logspath=self.__gistops_path )
+        logs.init_logs(
+          logspath=self.__gistops_path,
+          prefix='pandoc',
+          version=version.__version__)
 
         #######################
         # Pre-configure Shell #
@@ -77,8 +58,15 @@ class GistOps():
         return version.__version__
 
 
-    def convert(self, event_base64: Union[str,list], outpath: str='.gistops/data') -> str:
-        """Convert gists using *.pandoc.yml"""
+    def convert(self, 
+      event_base64: Union[str,list], 
+      outpath: str='.gistops/data', 
+      event_ndjson: str=None,
+      jobs: int=1,
+      cache_mb: int=1024) -> str:
+        """Convert gists using *.pandoc.yml on up to jobs threads,
+        streamed as ndjson to event_ndjson if given.
+        Outputs are reused from up to cache_mb of .gistops/cache/pandoc, 0 disables"""
 
         try:
             if isinstance(event_base64, list):
@@ -87,8 +75,8 @@ class GistOps():
                 eb64s = [event_base64] 
             else:
                 raise gists.GistOpsError(
-                  'event_base64 must bei either single base64 encoded event ' 
-                  'or list of base64 encoded events')
+                  'event_base64 must bei either single base64 encoded event, '
+                  'ndjson event file or list of those')
 
             try:
                 outpath = Path(outpath).resolve().relative_to(self.__git_root.resolve())
@@ -97,30 +85,39 @@ class GistOps():
                 'output path MUST be sub directory of git root'
                 'in order to be accessable from downstream ops') from err
 
-            convs: List[gists.Gist] = []
-            for eb64 in eb64s:
-                try:
-                    if Path(eb64).exists() and Path(eb64).is_file():
-                        with open(Path(eb64), 'r', encoding='utf-8') as event_base64_file:
-                            eb64 = event_base64_file.read()
-                except OSError:
-                    pass # e.g. filename to long for base64
-
-                failed = []
-                for gist in gists.from_event(eb64):
-                    try:
+            def gists_outpaths() -> Iterator[Tuple[gists.Gist, Path]]:
+                for eb64 in eb64s:
+                    for gist in gists.read_event(eb64):
                         # Check if gist is already relative to outpath
                         try:
                             gist.path.relative_to(Path(outpath))
-                            gist_outpath=Path('.')
+                            yield gist, Path('.')
                         except ValueError:
-                            gist_outpath=Path(outpath)
-
-                        convs.extend( converting.convert(
-                            shrun=self.__shrun, 
-                            gist=gist, 
-                            outpath=gist_outpath,
-                            dry_run=self.__dry_run) )
+                            yield gist, Path(outpath)
+
+            cache: caching.ConversionCache = None
+            if cache_mb > 0 and not self.__dry_run:
+                cache = caching.load(
+                  cache_path=self.__gistops_path.joinpath('cache').joinpath('pandoc'),
+                  max_bytes=cache_mb * 1024 * 1024,
+                  pandoc_version=self.__shrun(cmd=['pandoc','--version'], log_level=logging.DEBUG))
+
+            failed: List[str] = []
+            converted_from: Dict[Path, Path] = {}
+            def converted_gists() -> Iterator[gists.Gist]:
+                for gist, conversion in converting.convert_all(
+                  shrun=self.__shrun,
+                  gists_outpaths=gists_outpaths(),
+                  dry_run=self.__dry_run,
+                  jobs=jobs,
+                  cache=cache):
+                    try:
+                        convs = conversion.result()
+                        for conv in convs:
+                            if converted_from.setdefault(conv.path, gist.path) != gist.path:
+                                raise gists.GistOpsError(
+                                  f'{conv.path} of {gist.path} collides with '
+                                  f'conversion of {converted_from[conv.path]}')
 
                         logging.getLogger('gistops.trail').info(
                           f'{gist.trace_id},{gist.path.name} converted')
@@ -130,13 +127,26 @@ class GistOps():
                           f'{gist.trace_id},convertion failed for {gist.path.name}')
                         logging.getLogger().error(err, exc_info=True)
                         failed.append(gist.trace_id)
-                
-                if len(failed) > 0:
-                    raise gists.GistOpsError(
-                      f'Gists {failed} failed during convertion. '
-                      'See previous errors.')
-                    
-            return gists.to_event( convs )
+                        continue
+
+                    yield from convs
+
+            if event_ndjson is not None:
+                event = gists.to_ndjson(converted_gists(), Path(event_ndjson))
+            else:
+                event = gists.to_event(list(converted_gists()))
+
+            if cache is not None:
+                caching.store(cache)
+                logging.getLogger('gistops.trail').info(
+                  f'*,pandoc cache {cache.hits} hits and {cache.misses} misses')
+
+            if len(failed) > 0:
+                raise gists.GistOpsError(
+                  f'Gists {failed} failed during convertion. '
+                  'See previous errors.')
+
+            return event
       
         except Exception as err:
             logging.getLogger('gistops.trail').error('*,unexpected error')
@@ -144,9 +154,14 @@ class GistOps():
             raise err
 
 
-    def run(self, event_base64: Union[str,list], outpath: str='.gistops/data') -> str:
+    def run(self, 
+      event_base64: Union[str,list], 
+      outpath: str='.gistops/data', 
+      event_ndjson: str=None,
+      jobs: int=1,
+      cache_mb: int=1024) -> str:
         """Convert gists using *.pandoc.yml"""
-        return self.convert(event_base64, outpath)
+        return self.convert(event_base64, outpath, event_ndjson, jobs, cache_mb)
 
 
 def main():
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for pandoc gistops image
+
+Run explicitly with
+> GISTOPS_BENCHMARK=1 python3 -m pytest -s tests/test_pandoc_benchmark.py
+"""
+import os
+import sys
+import time
+import logging
+from functools import partial
+from pathlib import Path
+
+import pytest
+
+from gistops_core import gists
+
+sys.path.append(
+  str(Path(os.path.realpath(__file__)).parent.parent.joinpath('gistops')))
+
+import shell
+import converting
+
+
+pytestmark = pytest.mark.skipif(
+  os.environ.get('GISTOPS_BENCHMARK') is None,
+  reason='benchmarks only run if GISTOPS_BENCHMARK is set')
+
+
+PANDOC_J2 = '''---
+metadata:
+  title: {{ parent | replace("-"," ") | replace("."," ") | capitalize }}
+  subtitle: |
+    {{ parent }} - {{ commit_id }}
+from: markdown
+to: %s
+resource-path:
+- .
+- img
+toc-depth: 3
+'''
+
+
+def __synthetic_gists(repopath: Path, dirs: int, gists_per_dir: int) -> list:
+    """Creates markdown gists sharing a pdf and a jira template per directory"""
+    repopath.joinpath('.git').mkdir(parents=True, exist_ok=True)
+
+    gsts = []
+    for dir_idx in range(dirs):
+        dir_path = repopath.joinpath(f'dir-{dir_idx:03d}')
+        dir_path.mkdir()
+        for to_format in ['pdf', 'jira']:
+            with open(dir_path.joinpath(f'{to_format}.pandoc.j2'), 'w', encoding='utf-8') as j2_file:
+                j2_file.write(PANDOC_J2 % to_format)
+
+        for gist_idx in range(gists_per_dir):
+            gist_path = dir_path.joinpath(f'gist-{gist_idx:05d}.md')
+            gist_path.touch()
+            gsts.append(gists.Gist(
+              path=gist_path.relative_to(repopath),
+              tags={},
+              commit_id='6cd014d',
+              resources=[],
+              trace_id=str(gist_path.relative_to(repopath)),
+              title=gist_path.name))
+
+    return gsts
+
+
+def test_benchmark_render_5k_gists_sharing_10_templates(tmp_path: Path):
+    """Reports runtime of rendering pandoc defaults of 5000 gists (dry run)"""
+    repopath = tmp_path.joinpath('repo')
+    gsts = __synthetic_gists(repopath, dirs=5, gists_per_dir=1000)
+
+    old_cwd = os.getcwd()
+    os.chdir(repopath)
+    logging.getLogger().setLevel(logging.WARNING) # ... measure rendering, not logging
+    try:
+        shrun = partial(shell.shrun, env=os.environ, cwd=repopath)
+
+        started = time.perf_counter()
+        convs = [ conv for gist in gsts for conv in converting.convert(
+          shrun=shrun, gist=gist, outpath=Path('.gistops/data'), dry_run=True) ]
+        seconds = time.perf_counter() - started
+    finally:
+        os.chdir(old_cwd)
+
+    assert len(convs) == 2 * len(gsts)
+    print(f'\nconvert: 5000 gists sharing 10 templates rendered in {seconds:.3f}s '
+      f'({len(gsts)/seconds:.0f} gists/s)')
@@ -0,0 +1,6 @@
+#!/usr/bin/env python3
+import os
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(os.path.realpath(__file__)).parent))
@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+"""
+Command line arguments for GistOps Operations
+"""
+import os
+import time
+import json
+import shutil
+import logging
+import subprocess
+from functools import partial
+from pathlib import Path
+from typing import Dict, List, Union
+
+import fire
+
+from gistops_core import gists, logs
+
+import stages
+import version
+
+
+class GistOps():
+    """gistops - Run all stages in a single process passing gists in memory"""
+
+
+    def __init__(self,
+      cwd: str = str(Path.cwd()),
+      stages_path: str = str(Path(os.path.realpath(__file__)).parent.parent.parent),
+      git_backend: str = 'shell',
+      dry_run: bool = False):
+
+        ############
+        # Git Root #
+        ############
+        # Make git root current working directory
+        # and make path relative to git root
+        self.__git_root = gists.assert_git_root(Path(cwd).resolve())
+        # Important as gist.path is a unique key
+        os.chdir(str(self.__git_root))
+        self.__gist_path = Path(cwd).resolve().relative_to(self.__git_root)
+
+        self.__gistops_path = self.__git_root.joinpath('.gistops')
+        self.__gistops_path.mkdir(parents=True, exist_ok=True)
+        logs.init_logs(
+          logspath=self.__gistops_path,
+          prefix='pipeline',
+          version=version.__version__,
+          trail=False)
+
+        self.__stages_path = Path(stages_path).resolve()
+        self.__git_backend = git_backend
+        self.__dry_run = dry_run
+
+
+    def version(self) -> str:
+        """Just print the version"""
+        return version.__version__
+
+
+    def __stage_logs(self, stage: str, trail: bool = True):
+        return logs.stage_logs(
+          logspath=self.__gistops_path,
+          prefix=stage,
+          version=version.__version__,
+          trail=trail)
+
+
+    def __trufflehog(self):
+        if shutil.which('trufflehog') is None:
+            logging.getLogger().warning(
+              'trufflehog not found on PATH, secrets are not scanned')
+            return
+
+        # Same defaults as gistops-trufflehog image
+        trufflehog_cmd = [
+          'trufflehog', 'git', f'file://{self.__git_root}', '--no-update',
+          '--fail', '--max-depth=1', '--json' ]
+        with open(self.__gistops_path.joinpath('trufflehog.gistops.log'),
+          'a', encoding='utf-8') as trufflehog_log:
+            trufflehog_log.write(' '.join(trufflehog_cmd) + '\n')
+            trufflehog_log.flush()
+            if subprocess.run(trufflehog_cmd,
+              stdout=trufflehog_log, stderr=subprocess.STDOUT, check=False).returncode != 0:
+                raise gists.GistOpsError(
+                  f'trufflehog detected secrets, see {trufflehog_log.name}')
+
+
+    def __git_ls_attr(self, git_hash: str) -> List[gists.Gist]:
+        mods = stages.load(self.__stages_path, 'git-ls-attr', 'iterate', 'backends')
+
+        git = mods['backends'].connect(
+          git_backend=self.__git_backend,
+          git_root=self.__git_root)
+
+        all_gsts: List[gists.Gist] = list(mods['iterate'].iterate_gists(
+          git=git,
+          git_root=self.__git_root,
+          gist_path=self.__gist_path,
+          index_path=self.__gistops_path.joinpath('git-ls-attr.index.json')))
+
+        with open(
+          self.__gistops_path.joinpath('gists.json'), 'w', encoding='utf-8') as gists_file:
+            gists_file.write(
+              json.dumps( [gists.to_basic_dict(gist) for gist in all_gsts] ) )
+
+        gsts: List[gists.Gist] = []
+        for gist in all_gsts if git_hash is None else mods['iterate'].changed_gists(
+          git=git,
+          gsts=all_gsts,
+          git_diff_hash=git_hash):
+
+            gsts.append(gist)
+            logging.getLogger('gistops.trail').info(f'{gist.trace_id},triggered')
+
+        return gsts
+
+
+    def __outpath(self, gist: gists.Gist, outpath: Path) -> Path:
+        # Check if gist is already relative to outpath
+        try:
+            gist.path.relative_to(outpath)
+            return Path('.')
+        except ValueError:
+            return outpath
+
+
+    def __jupyter(self, gsts: List[gists.Gist], outpath: Path) -> List[gists.Gist]:
+        ipynbs = [ gist for gist in gsts if gist.path.suffix == '.ipynb' ]
+        if len(ipynbs) == 0:
+            return [] # ... jupyter requirements are only needed for notebooks
+
+        mods = stages.load(self.__stages_path, 'jupyter', 'extract')
+
+        nbs: List[gists.Gist] = []
+        failed: List[str] = []
+        for gist in ipynbs:
+            try:
+                nbs.extend( mods['extract'].extract(
+                  gist = gist,
+                  outpath = self.__outpath(gist, outpath)) )
+
+                logging.getLogger('gistops.trail').info(f'{gist.path},converted')
+
+            except Exception as err:
+                logging.getLogger('gistops.trail').error(f'{gist.path},convertion failed')
+                logging.getLogger().error(err, exc_info=True)
+                failed.append(gist.trace_id)
+
+        if len(failed) > 0:
+            raise gists.GistOpsError(
+              f'Failed to convert ipynb {failed}, see previous errors')
+
+        return nbs
+
+
+    def __pandoc(self,
+      gsts: List[gists.Gist],
+      outpath: Path,
+      jobs: int,
+      cache_mb: int) -> List[gists.Gist]:
+        mods = stages.load(self.__stages_path, 'pandoc', 'converting', 'caching', 'shell')
+
+        shrun = partial(
+          mods['shell'].shrun,
+          env=os.environ,
+          cwd=self.__git_root.resolve())
+
+        cache = None
+        if cache_mb > 0 and not self.__dry_run:
+            cache = mods['caching'].load(
+              cache_path=self.__gistops_path.joinpath('cache').joinpath('pandoc'),
+              max_bytes=cache_mb * 1024 * 1024,
+              pandoc_version=shrun(cmd=['pandoc','--version'], log_level=logging.DEBUG))
+
+        convs: List[gists.Gist] = []
+        failed: List[str] = []
+        converted_from: Dict[Path, Path] = {}
+        for gist, conversion in mods['converting'].convert_all(
+          shrun=shrun,
+          gists_outpaths=[ (gist, self.__outpath(gist, outpath)) for gist in gsts ],
+          dry_run=self.__dry_run,
+          jobs=jobs,
+          cache=cache):
+            try:
+                gist_convs = conversion.result()
+                for conv in gist_convs:
+                    if converted_from.setdefault(conv.path, gist.path) != gist.path:
+                        raise gists.GistOpsError(
+                          f'{conv.path} of {gist.path} collides with '
+                          f'conversion of {converted_from[conv.path]}')
+                convs.extend(gist_convs)
+
+                logging.getLogger('gistops.trail').info(
+                  f'{gist.trace_id},{gist.path.name} converted')
+
+            except Exception as err:
+                logging.getLogger('gistops.trail').error(
+                  f'{gist.trace_id},convertion failed for {gist.path.name}')
+                logging.getLogger().error(err, exc_info=True)
+                failed.append(gist.trace_id)
+
+        if cache is not None:
+            mods['caching'].store(cache)
+            logging.getLogger('gistops.trail').info(
+              f'*,pandoc cache {cache.hits} hits and {cache.misses} misses')
+
+        if len(failed) > 0:
+            raise gists.GistOpsError(
+              f'Gists {failed} failed during convertion. '
+              'See previous errors.')
+
+        return convs
+
+
+    def __publish(self, stage: str, api_name: str, api, gsts: List[gists.Gist]):
+        publishing = stages.load(self.__stages_path, stage, 'publishing')['publishing']
+
+        # Pages before their attachments, like the stage images
+        failed: List[str] = []
+        for gist in sorted(gsts, key=lambda g: 0 if g.path.suffix == '.jira' else 1):
+            if publishing.publish(
+              **{api_name: api}, gist = gist, dry_run = self.__dry_run) is False:
+                failed.append(gist.trace_id)
+
+        if len(failed) > 0:
+            raise gists.GistOpsError(
+              f'Failed to publish gists {failed}, see previous errors')
+
+
+    def __msteams(self, webhook_url: str, report_title: str):
+        mods = stages.load(self.__stages_path, 'msteams', 'reporting', 'trails')
+
+        mods['reporting'].report(
+          webhook_api = mods['reporting'].to_webhook_api(webhook_url),
+          report_title=report_title,
+          gsts=gists.from_file(gists_json_path=self.__gistops_path.joinpath('gists.json')),
+          traillogs=mods['trails'].from_files(
+            gistops_trail_dir=self.__gistops_path,
+            gistops_trail_postfix='gistops.trail') )
+
+
+    def pipeline(self,
+      git_hash: str = None,
+      outpath: str = '.gistops/data',
+      skip: Union[str,list,tuple] = (),
+      jobs: int = 1,
+      cache_mb: int = 1024) -> Dict[str,float]:
+        """Run trufflehog, git-ls-attr, jupyter, pandoc, jira, confluence and msteams
+        in this process and return the wall time in seconds per stage"""
+
+        if isinstance(skip, str):
+            skip = [ stage.strip() for stage in skip.split(',') ]
+
+        try:
+            outpath = Path(outpath).resolve().relative_to(self.__git_root.resolve())
+        except ValueError as err:
+            raise gists.GistOpsError(
+              'output path MUST be sub directory of git root'
+              'in order to be accessable from downstream ops') from err
+
+        timings: Dict[str,float] = {}
+        def timed(stage: str, run_stage, trail: bool = True):
+            if stage in skip:
+                return None
+
+            started = time.perf_counter()
+            try:
+                with self.__stage_logs(stage, trail=trail):
+                    try:
+                        return run_stage()
+                    except Exception as err:
+                        logging.getLogger('gistops.trail').error('*,unexpected error')
+                        logging.getLogger().error(err, exc_info=True)
+                        raise err
+            finally:
+                timings[stage] = time.perf_counter() - started
+                logging.getLogger().info(f'{stage} took {timings[stage]:.3f}s')
+
+        # 1. analyze
+        timed('trufflehog', self.__trufflehog, trail=False)
+        gsts = timed('git-ls-attr', partial(self.__git_ls_attr, git_hash=git_hash)) or []
+
+        # 2. convert
+        nbs = timed('jupyter', partial(self.__jupyter, gsts=gsts, outpath=outpath)) or []
+        convs = timed('pandoc', partial(self.__pandoc,
+          gsts=gsts + nbs, outpath=outpath, jobs=jobs, cache_mb=cache_mb)) or []
+
+        # 3. publish, only if configured as in scripts/gistops.sh
+        if os.environ.get('GISTOPS_JIRA_URL') and os.environ.get('GISTOPS_JIRA_ACCESS_TOKEN'):
+            timed('jira', lambda: self.__publish(
+              stage='jira', api_name='jira', gsts=convs,
+              api=stages.load(self.__stages_path, 'jira', 'publishing')['publishing']
+                .connect_to_api(
+                  os.environ['GISTOPS_JIRA_URL'],
+                  os.environ['GISTOPS_JIRA_ACCESS_TOKEN'])))
+
+        if os.environ.get('GISTOPS_CONFLUENCE_URL') and \
+          os.environ.get('GISTOPS_CONFLUENCE_ACCESS_TOKEN'):
+            timed('confluence', lambda: self.__publish(
+              stage='confluence', api_name='cnfl', gsts=convs,
+              api=stages.load(self.__stages_path, 'confluence', 'publishing')['publishing']
+                .connect_to_api(
+                  os.environ['GISTOPS_CONFLUENCE_URL'],
+                  os.environ['GISTOPS_CONFLUENCE_ACCESS_TOKEN'])))
+
+        # 4. report
+        if os.environ.get('GISTOPS_MSTEAMS_WEBHOOK_URL') and \
+          os.environ.get('GISTOPS_MSTEAMS_REPORT_TITLE'):
+            timed('msteams', partial(self.__msteams,
+              webhook_url=os.environ['GISTOPS_MSTEAMS_WEBHOOK_URL'],
+              report_title=os.environ['GISTOPS_MSTEAMS_REPORT_TITLE']), trail=False)
+
+        return { stage: round(seconds, 3) for stage, seconds in timings.items() }
+
+
+    def run(self,
+      git_hash: str = None,
+      outpath: str = '.gistops/data',
+      skip: Union[str,list,tuple] = (),
+      jobs: int = 1,
+      cache_mb: int = 1024) -> Dict[str,float]:
+        """Run all stages in this process"""
+        return self.pipeline(
+          git_hash=git_hash, outpath=outpath, skip=skip, jobs=jobs, cache_mb=cache_mb)
+
+
+def main():
+    """gistops entrypoint"""
+    fire.Fire(GistOps)
+
+
+if __name__ == '__main__':
+    main()
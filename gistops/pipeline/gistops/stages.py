@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Import stage modules side by side into a single process
+"""
+import sys
+import importlib
+from pathlib import Path
+from types import ModuleType
+from typing import Dict
+
+from gistops_core import gists
+
+
+__LOADED: Dict[str, Dict[str,ModuleType]] = {}
+
+
+######################
+# EXPORTED FUNCTIONS #
+######################
+def load(stages_path: Path, stage: str, *module_names: str) -> Dict[str,ModuleType]:
+    """Import modules of a stage, e.g. load(path, 'jira', 'publishing')
+
+    Stages import their own modules flat (import shell, import publishing)
+    and reuse names across stages. Each stage is therefore imported with
+    its directory first on sys.path and its flat names removed from
+    sys.modules afterwards, the imported modules keep their references.
+    """
+    stage_gistops_path = stages_path.joinpath(stage).joinpath('gistops').resolve()
+    if not stage_gistops_path.is_dir():
+        raise gists.GistOpsError(
+          f'Stage {stage} not found in {stages_path}, '
+          'please provide the gistops directory of the repository as stages path')
+
+    loaded = __LOADED.setdefault(str(stage_gistops_path), {})
+    missing = [ name for name in module_names if name not in loaded ]
+    if len(missing) == 0:
+        return { name: loaded[name] for name in module_names }
+
+    stage_names = { py_path.stem for py_path in stage_gistops_path.glob('*.py') }
+    shadowed = { name: sys.modules.pop(name) for name in stage_names if name in sys.modules }
+    sys.modules.update(loaded) # ... modules of the stage imported earlier
+    sys.path.insert(0, str(stage_gistops_path))
+    try:
+        for name in missing:
+            loaded[name] = importlib.import_module(name)
+    except ImportError as err:
+        raise gists.GistOpsError(
+          f'Stage {stage} could not be imported, please install '
+          f'{stages_path.joinpath(stage).joinpath("requirements.txt")}') from err
+    finally:
+        sys.path.remove(str(stage_gistops_path))
+        for name in stage_names:
+            sys.modules.pop(name, None)
+        sys.modules.update(shadowed)
+
+    return { name: loaded[name] for name in module_names }
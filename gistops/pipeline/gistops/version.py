@@ -0,0 +1,9 @@
+#!/usr/bin/env python3
+"""
+Global project variables
+"""
+
+__author__ = 'dandens'
+__project__ ='gistops'
+__semver__ = '0.1.0-beta'
+__version__ = f'{__author__}/{__project__} {__semver__}'
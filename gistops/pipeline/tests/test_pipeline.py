@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Tests for gistops pipeline
+"""
+import os
+import sys
+import zipfile
+from pathlib import Path
+
+import pytest
+
+sys.path.append(
+  str(Path(os.path.realpath(__file__)).parent.parent.joinpath('gistops')))
+
+import main
+import stages
+
+
+STAGES_PATH = Path(os.path.realpath(__file__)).parent.parent.parent
+
+
+@pytest.fixture()
+def git_ls_attr_repository(tmp_path: Path):
+    """Unpacks git repository of git-ls-attr tests"""
+    repozip = STAGES_PATH.joinpath('git-ls-attr').joinpath(
+      'tests').joinpath('repos').joinpath('test_git_ls_attr.zip')
+
+    with zipfile.ZipFile(repozip,'r') as repo_zip:
+        repo_zip.extractall( path=tmp_path )
+
+    old_cwd = os.getcwd()
+    yield tmp_path
+    os.chdir(old_cwd)
+
+
+def test_stages_are_loaded_side_by_side():
+    """Tests stages reusing module names are imported as distinct modules"""
+
+    jira = stages.load(STAGES_PATH, 'jira', 'publishing')['publishing']
+    confluence = stages.load(STAGES_PATH, 'confluence', 'publishing')['publishing']
+
+    assert jira is not confluence
+    assert Path(jira.__file__).parent.parent.name == 'jira'
+    assert Path(confluence.__file__).parent.parent.name == 'confluence'
+    assert 'publishing' not in sys.modules
+
+    # ... and imported only once
+    assert stages.load(STAGES_PATH, 'jira', 'publishing')['publishing'] is jira
+
+
+def test_pipeline_passes_gists_in_memory(git_ls_attr_repository: Path, monkeypatch):
+    """Tests gists are located and converted in a single process"""
+    for env_var in ['GISTOPS_JIRA_URL', 'GISTOPS_CONFLUENCE_URL', 'GISTOPS_MSTEAMS_WEBHOOK_URL']:
+        monkeypatch.delenv(env_var, raising=False)
+
+    timings = main.GistOps(
+      cwd=str(git_ls_attr_repository),
+      stages_path=str(STAGES_PATH),
+      dry_run=True).pipeline(skip='trufflehog', jobs=2)
+
+    # Publishing and reporting are skipped without credentials
+    assert list(timings.keys()) == ['git-ls-attr', 'jupyter', 'pandoc']
+
+    gistops_path = git_ls_attr_repository.joinpath('.gistops')
+    assert gistops_path.joinpath('gists.json').exists()
+    with open(gistops_path.joinpath('git-ls-attr.gistops.trail'), encoding='utf-8') as trail:
+        assert ',triggered' in trail.read()
@@ -4,6 +4,14 @@ set -e
 ################
 # Check Params #
 ################
+GISTOPS_SCRIPTS_DIR=$(dirname "$(realpath "$0")")
+if [[ "$GISTOPS_RUN_MODE" == "process" ]]; then
+    # all stages in a single python process, see gistops/pipeline
+    python3 "$GISTOPS_SCRIPTS_DIR/../gistops/pipeline/gistops/main.py" \
+      pipeline --cwd "$(realpath "${1:-.}")" --jobs "${GISTOPS_PANDOC_JOBS:-1}"
+    exit $?
+fi
+
 if ! docker info >/dev/null 2>&1; then
     echo \
     "Docker is not running or user \"$USER\" is not allowed to access docker; " \